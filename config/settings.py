@@ -148,6 +148,47 @@ else:
         }
     }
 
+# ---------------------------------------------------------------------
+# CACHE
+# ---------------------------------------------------------------------
+# Recipe result payloads and API responses are cached. Set REDIS_URL in
+# production so all gunicorn workers share one cache (requires `redis`);
+# the per-process in-memory cache is fine for local dev and tests.
+REDIS_URL = os.getenv("REDIS_URL")
+# Only a Redis cache is seen by every worker. Code that relies on cross-process
+# invalidation or on the cache as the sole copy of data checks this flag.
+CACHE_IS_SHARED = bool(REDIS_URL)
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "smart-recipe",
+            # Results bundles, API responses and pantry data share this cache;
+            # the default of 300 entries would evict them within minutes.
+            "OPTIONS": {"MAX_ENTRIES": 5000},
+        }
+    }
+
+# Sessions are read on every request: with a shared cache, serve them from it
+# and only fall back to the database on a miss. A per-process cache would let
+# other workers keep serving a session after logout/flush or a write, so the
+# plain database engine is used then.
+SESSION_ENGINE = (
+    "django.contrib.sessions.backends.cached_db"
+    if CACHE_IS_SHARED
+    else "django.contrib.sessions.backends.db"
+)
+# Sessions only hold small tokens/flags (result payloads live in the cache,
+# compressed; see _store_results in core/views.py), so plain JSON is enough.
+SESSION_SERIALIZER = "django.contrib.sessions.serializers.JSONSerializer"
+
 # ---------------------------------------------------------------------
 # PASSWORD VALIDATION
 # ---------------------------------------------------------------------
@@ -183,6 +224,13 @@ WHITENOISE_MAX_AGE = 31536000
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Spool uploads straight to a temp file instead of buffering them in memory.
+# FileSystemStorage then moves the temp file into place, and S3Boto3Storage
+# streams it with upload_fileobj, so photos never sit whole in the heap.
+FILE_UPLOAD_HANDLERS = [
+    "django.core.files.uploadhandler.TemporaryFileUploadHandler",
+]
+
 # Toggle S3
 USE_S3 = os.getenv("USE_S3", "") == "1"
 
@@ -200,6 +248,9 @@ if USE_S3:
     AWS_QUERYSTRING_AUTH = False  # public, cacheable URLs
     AWS_S3_FILE_OVERWRITE = False
     AWS_DEFAULT_ACL = None
+    # Uploaded/cached images get unique names and are never rewritten in place,
+    # so browsers and CDNs may keep them for a week without revalidating.
+    AWS_S3_OBJECT_PARAMETERS = {"CacheControl": "public, max-age=604800, immutable"}
     # Optional helpers:
     # AWS_S3_ADDRESSING_STYLE = "virtual"
     AWS_S3_SIGNATURE_VERSION = "s3v4"
@@ -249,3 +300,27 @@ ENABLE_AI_IMAGES = os.getenv("ENABLE_AI_IMAGES", "false").lower() in (
     "true",
     "yes",
 )
+
+# ---------------------------------------------------------------------
+# Background tasks (in-process thread pool; see core/services/background.py)
+# ---------------------------------------------------------------------
+BACKGROUND_TASKS_ENABLED = os.getenv("BACKGROUND_TASKS_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+BACKGROUND_TASK_WORKERS = int(os.getenv("BACKGROUND_TASK_WORKERS", "4"))
+# Run OpenAI Vision alongside OCR for pantry photos (faster when OCR finds
+# nothing, but pays for a Vision call on every upload).
+PANTRY_EXTRACT_PARALLEL = os.getenv("PANTRY_EXTRACT_PARALLEL", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# ---------------------------------------------------------------------
+# Unified recipe search
+# ---------------------------------------------------------------------
+# Skip the OpenAI call when Spoonacular alone returns at least this many
+# recipes. 0 disables the gate (both sources are always queried, in parallel).
+AI_ONLY_IF_FEWER_THAN = int(os.getenv("AI_ONLY_IF_FEWER_THAN", "8"))
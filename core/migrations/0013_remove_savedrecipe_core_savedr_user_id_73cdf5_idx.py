@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-16 10:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0012_savedrecipe_calories_savedrecipe_carbs_g_and_more"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="savedrecipe",
+            name="core_savedr_user_id_73cdf5_idx",
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-16 12:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0013_remove_savedrecipe_core_savedr_user_id_73cdf5_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="meal",
+            name="core_meal_plan_id_e616a5_idx",
+        ),
+    ]
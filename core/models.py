@@ -46,7 +46,9 @@ class Ingredient(models.Model):
 
         ordering = ["name"]
         constraints = [
-            # Case-insensitive uniqueness per user
+            # Case-insensitive uniqueness per user. Its (lower(name), user)
+            # expression index also serves the Lower("name")__in lookup in
+            # the pantry review, so no separate functional index is needed.
             models.UniqueConstraint(
                 Lower("name"),
                 "user",
@@ -125,8 +127,9 @@ class SavedRecipe(models.Model):
                 name="uniq_saved_recipe_user_source_extid",
             )
         ]
+        # (user, source) lookups are served by the unique constraint above,
+        # whose leading columns match; a separate index would only slow writes.
         indexes = [
-            Index(fields=["user", "source"]),
             Index(fields=["source", "external_id"]),
         ]
 
@@ -196,15 +199,14 @@ class Meal(models.Model):
     notes = models.CharField(max_length=255, blank=True)
 
     class Meta:
+        # (plan, date[, meal_type]) lookups use the unique constraint's index,
+        # whose leading columns match; a separate index would only slow writes.
         constraints = [
             models.UniqueConstraint(
                 fields=["plan", "date", "meal_type"], name="unique_meal_slot"
             )
         ]
         ordering = ["date", "meal_type"]
-        indexes = [
-            Index(fields=["plan", "date"]),
-        ]
 
     def __str__(self) -> str:
         return f"{self.date} {self.meal_type} ({self.plan.user})"
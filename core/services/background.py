@@ -0,0 +1,60 @@
+"""
+Minimal in-process background runner for slow, best-effort work.
+
+The app has no task queue (Celery/RQ) on Render, so slow jobs such as
+OCR + OpenAI Vision run on a small shared thread pool instead of holding a
+gunicorn worker for the whole request. Jobs must be idempotent and must
+only receive plain values (ids, paths, URLs) — never the request object.
+
+Set BACKGROUND_TASKS_ENABLED=false to run jobs inline (tests, debugging).
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    # Created lazily so a preloading/forking server never inherits a dead pool.
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "BACKGROUND_TASK_WORKERS", 4),
+                    thread_name_prefix="smart-recipe-bg",
+                )
+    return _EXECUTOR
+
+
+def _run(fn, args, kwargs) -> None:
+    """Run a job on a pool thread with its own, properly recycled DB connection."""
+    close_old_connections()
+    try:
+        fn(*args, **kwargs)
+    except Exception:
+        logger.exception("Background task %s failed.", getattr(fn, "__name__", fn))
+    finally:
+        close_old_connections()
+
+
+def run_in_background(fn, *args, **kwargs) -> None:
+    """
+    Schedule `fn(*args, **kwargs)` off the request thread.
+    Falls back to running inline when background tasks are disabled.
+    """
+    if not getattr(settings, "BACKGROUND_TASKS_ENABLED", True):
+        try:
+            fn(*args, **kwargs)
+        except Exception:
+            logger.exception("Inline task %s failed.", getattr(fn, "__name__", fn))
+        return
+    _get_executor().submit(_run, fn, args, kwargs)
@@ -0,0 +1,109 @@
+"""
+Shared HTTP session for outbound API calls (Spoonacular, OpenAI, image CDNs).
+
+A single pooled `requests.Session` keeps TCP/TLS connections alive between
+calls instead of paying a fresh handshake for every `requests.get/post`.
+Sessions are safe to share across the thread pools used by the views.
+
+Retries only cover idempotent requests and transient 5xx errors; 402/429 are
+returned as-is so callers keep their graceful quota handling.
+
+JSON is decoded/encoded with orjson when it is installed (several times faster
+than the stdlib on large informationBulk payloads), falling back to `json`.
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+USER_AGENT = "SmartRecipe/1.0 (+https://smart-recipe-app-b3x7.onrender.com)"
+# Keep-alive connections kept per host; thread fan-outs should stay below this.
+POOL_MAXSIZE = 20
+
+
+def build_session() -> requests.Session:
+    """Create a pooled session with conservative retries for GET requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+SESSION = build_session()
+
+# Optional side work started while serving a request (e.g. pantry Vision
+# alongside OCR). Latency-critical fan-outs whose callers enforce timeouts use
+# their own short-lived executor instead, so they never queue behind this pool.
+IO_POOL_WORKERS = 8
+_IO_POOL = None
+_IO_POOL_LOCK = threading.Lock()
+
+
+def io_pool() -> ThreadPoolExecutor:
+    """
+    Return the shared pool for concurrent outbound calls made while serving a
+    request. Tasks must not submit to (and wait on) this pool themselves.
+    """
+    # Created lazily so a preloading/forking server never inherits a dead pool.
+    global _IO_POOL
+    if _IO_POOL is None:
+        with _IO_POOL_LOCK:
+            if _IO_POOL is None:
+                _IO_POOL = ThreadPoolExecutor(
+                    max_workers=IO_POOL_WORKERS, thread_name_prefix="smart-recipe-io"
+                )
+    return _IO_POOL
+
+
+def loads(data):
+    """Decode a JSON str/bytes document, preferring orjson."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Encode `obj` as compact JSON bytes, preferring orjson."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:  # e.g. Decimal: let the stdlib raise a clear error
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def response_json(resp):
+    """
+    Decode a response body like `resp.json()`, via orjson when available.
+    Objects without raw `content` (e.g. test doubles) use their own `.json()`.
+    """
+    content = getattr(resp, "content", None)
+    if orjson is not None and isinstance(content, (bytes, str)) and content:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return resp.json()
@@ -1,22 +1,68 @@
 """Image lookup helpers for recipes when an upstream source lacks images."""
 
+import hashlib
 import logging
 import os
 import re
 import uuid
 import mimetypes
+from functools import wraps
 from typing import Optional
-import requests
+from django.core.cache import cache
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from uuid import uuid4
 
+from .http import SESSION, response_json
+
 logger = logging.getLogger(__name__)
 
 # -------- Spoonacular: title -> representative image URL --------
 SPOON_KEY = os.getenv("SPOONACULAR_API_KEY")
 
 
+# -------- Title -> image lookup cache --------
+# Spoonacular bills every complexSearch against a daily point budget, and the
+# same dish titles come up across users. Hits are kept for a week; misses
+# (including quota errors) for an hour so we don't hammer the API.
+IMAGE_LOOKUP_CACHE_TTL = 7 * 24 * 3600
+IMAGE_LOOKUP_MISS_TTL = 3600
+
+
+def title_image_cache_key(namespace: str, title: str) -> Optional[str]:
+    norm = (title or "").strip().lower()
+    if not norm:
+        return None
+    return f"{namespace}:{hashlib.sha1(norm.encode()).hexdigest()}"
+
+
+def cached_title_image(namespace: str):
+    """Decorator: cache a `title -> Optional[url]` lookup in the Django cache."""
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(title: str) -> Optional[str]:
+            key = title_image_cache_key(namespace, title)
+            if key is None:
+                return fn(title)
+            hit = cache.get(key)
+            if hit is not None:
+                return hit or None
+            url = fn(title)
+            cache.set(
+                key,
+                url or "",
+                IMAGE_LOOKUP_CACHE_TTL if url else IMAGE_LOOKUP_MISS_TTL,
+            )
+            return url
+
+        return wrapper
+
+    return decorator
+
+
+# Same complexSearch title query as views' fallback lookup: share its entries.
+@cached_title_image("spoon:fallback")
 def spoonacular_image_for(title: str) -> Optional[str]:
     """
     Best-effort: look up a representative image URL for a recipe title using Spoonacular.
@@ -27,7 +73,7 @@ def spoonacular_image_for(title: str) -> Optional[str]:
         return None
 
     try:
-        r = requests.get(
+        r = SESSION.get(
             "https://api.spoonacular.com/recipes/complexSearch",
             params={
                 "apiKey": SPOON_KEY,
@@ -42,7 +88,7 @@ def spoonacular_image_for(title: str) -> Optional[str]:
         if r.status_code in (402, 429) or r.status_code != 200:
             return None
 
-        payload = r.json() or {}
+        payload = response_json(r) or {}
         results = payload.get("results") or []
         if not results:
             return None
@@ -62,10 +108,12 @@ CONTENT_TYPE_MAP = {
 }
 
 
+# Any run of non-alphanumerics (hyphens included) becomes one "-" in a single pass.
+_SLUG_SEP_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _safe_slug(s: str) -> str:
-    s = (s or "").strip().lower()
-    s = re.sub(r"[^a-z0-9\-]+", "-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
+    s = _SLUG_SEP_RE.sub("-", (s or "").strip().lower()).strip("-")
     return s or uuid.uuid4().hex
 
 
@@ -100,7 +148,7 @@ def cache_remote_image_to_storage(
     if not url:
         return None
     try:
-        resp = requests.get(url, timeout=10)
+        resp = SESSION.get(url, timeout=10)
         resp.raise_for_status()
         ext = ".jpg"
         name = f"{folder}{uuid4().hex}{ext}"
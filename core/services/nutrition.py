@@ -111,11 +111,20 @@ def sync_logged_meals_from_plan(user, day: _date):
     )
 
     # If your ORM/DB stores start_date with timezones, widen the window:
-    if not plans.exists():
+    plans = list(plans)
+    if not plans:
         plans = MealPlan.objects.filter(
             user=user, start_date__gte=start - timedelta(days=6), start_date__lte=start
         )
 
+    # What is already logged today, read once instead of one EXISTS per item
+    logged = set(
+        LoggedMeal.objects.filter(user=user, date=day).values_list(
+            "meal_type", "source_recipe_id"
+        )
+    )
+    new_rows = []
+
     for plan in plans:
         meals_rel = getattr(plan, "meals", None)
         if not meals_rel:
@@ -146,11 +155,9 @@ def sync_logged_meals_from_plan(user, day: _date):
             recipe_id = str(recipe_id or "")
 
             # Skip if we already logged this recipe for this slot/day
-            exists = LoggedMeal.objects.filter(
-                user=user, date=day, meal_type=meal_type, source_recipe_id=recipe_id
-            ).exists()
-            if exists:
+            if (meal_type, recipe_id) in logged:
                 continue
+            logged.add((meal_type, recipe_id))
 
             title = (
                 getattr(item, "title", None)
@@ -163,14 +170,20 @@ def sync_logged_meals_from_plan(user, day: _date):
             carbs = getattr(item, "carbs_g", 0) or 0
             fat = getattr(item, "fat_g", 0) or 0
 
-            LoggedMeal.objects.create(
-                user=user,
-                date=day,
-                meal_type=meal_type,
-                title=title,
-                source_recipe_id=recipe_id,
-                calories=int(cals),
-                protein_g=int(prot),
-                carbs_g=int(carbs),
-                fat_g=int(fat),
+            new_rows.append(
+                LoggedMeal(
+                    user=user,
+                    date=day,
+                    meal_type=meal_type,
+                    title=title,
+                    source_recipe_id=recipe_id,
+                    calories=int(cals),
+                    protein_g=int(prot),
+                    carbs_g=int(carbs),
+                    fat_g=int(fat),
+                )
             )
+
+    # One INSERT for everything that was missing
+    if new_rows:
+        LoggedMeal.objects.bulk_create(new_rows, batch_size=200)
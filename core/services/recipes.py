@@ -13,9 +13,10 @@ Each dict will look like:
 """
 
 import os
-import requests
 import logging
 
+from .http import SESSION, response_json
+
 logger = logging.getLogger(__name__)
 
 # Spoonacular base URL and API key (from environment)
@@ -66,9 +67,9 @@ def spoon_search(
         params["maxCalories"] = max_calories
 
     try:
-        resp = requests.get(SPOON_BASE, params=params, timeout=10)
+        resp = SESSION.get(SPOON_BASE, params=params, timeout=10)
         resp.raise_for_status()
-        data = resp.json()
+        data = response_json(resp)
     except Exception as e:
         logger.error("Spoonacular API error: %s", e, exc_info=True)
         return []
@@ -1,6 +1,7 @@
 import os
 import re
-import requests
+
+from .services.http import SESSION, response_json
 
 SPOON_KEY = os.getenv("SPOONACULAR_API_KEY")
 
@@ -46,13 +47,13 @@ def spoonacular_macros_for(
     if external_id and str(external_id).isdigit():
         rid = str(external_id).strip()
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 f"https://api.spoonacular.com/recipes/{rid}/nutritionWidget.json",
                 params={"apiKey": SPOON_KEY},
                 timeout=10,
             )
             if resp.status_code == 200:
-                data = resp.json() or {}
+                data = response_json(resp) or {}
                 return {
                     "calories": _number_from_str(data.get("calories")),
                     "protein_g": _number_from_str(data.get("protein")),
@@ -64,13 +65,13 @@ def spoonacular_macros_for(
 
         # Fallback: full information (heavier, but reliable)
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 f"https://api.spoonacular.com/recipes/{rid}/information",
                 params={"apiKey": SPOON_KEY, "includeNutrition": "true"},
                 timeout=12,
             )
             if resp.status_code == 200:
-                data = resp.json() or {}
+                data = response_json(resp) or {}
                 nutrients = (data.get("nutrition") or {}).get("nutrients") or []
                 return {
                     "calories": _pick_macro(nutrients, "calories"),
@@ -84,13 +85,13 @@ def spoonacular_macros_for(
     # 2) Title path: guessNutrition
     if title:
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 "https://api.spoonacular.com/recipes/guessNutrition",
                 params={"title": title, "apiKey": SPOON_KEY},
                 timeout=10,
             )
             if resp.status_code == 200:
-                g = resp.json() or {}
+                g = response_json(resp) or {}
                 return {
                     "calories": (g.get("calories") or {}).get("value"),
                     "protein_g": (g.get("protein") or {}).get("value"),
@@ -114,14 +115,14 @@ def spoonacular_recipe_info(sid: str) -> dict:
         return {}
 
     try:
-        resp = requests.get(
+        resp = SESSION.get(
             f"https://api.spoonacular.com/recipes/{sid}/information",
             params={"apiKey": SPOON_KEY, "includeNutrition": "true"},
             timeout=12,
         )
         if resp.status_code != 200:
             return {}
-        data = resp.json() or {}
+        data = response_json(resp) or {}
         return {
             "id": data.get("id"),
             "title": data.get("title"),
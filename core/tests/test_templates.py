@@ -1,6 +1,7 @@
 from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from core.models import SavedRecipe
 
 User = get_user_model()
@@ -8,6 +9,7 @@ User = get_user_model()
 
 class TemplateSmokeTests(TestCase):
     def setUp(self):
+        cache.clear()  # favorites rows are cached per user id
         self.user = User.objects.create_user(username="tina", password="pass123")
         self.client.login(username="tina", password="pass123")
 
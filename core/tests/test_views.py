@@ -3,9 +3,19 @@ from unittest.mock import patch
 from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.utils.html import escape
 
-from core.models import Ingredient, SavedRecipe
+from core.models import Ingredient, PantryImageUpload, SavedRecipe
+from core.views import (
+    _cache_get_results,
+    _extract_candidates,
+    _heuristic_ai_steps,
+    _looks_like_text,
+    _cache_set_results,
+    _parse_ingredients_from_text,
+    _title_image_cache_key,
+)
 
 User = get_user_model()
 
@@ -38,6 +48,7 @@ class SpoonacularWebRecipesTests(TestCase):
     """
 
     def setUp(self):
+        cache.clear()  # pantry/API/results caches persist between tests
         self.user = User.objects.create_user(username="testuser", password="pass123")
         self.client.login(username="testuser", password="pass123")
         Ingredient.objects.create(user=self.user, name="bell pepper")
@@ -45,7 +56,7 @@ class SpoonacularWebRecipesTests(TestCase):
         Ingredient.objects.create(user=self.user, name="onion")
 
     @patch.dict("os.environ", {"SPOONACULAR_API_KEY": "spoon-test"})
-    @patch("core.views.requests.get")
+    @patch("core.views._SESSION.get")
     def test_web_recipes_success(self, mock_get):
         """Happy path: mocked Spoonacular responses, expect 200 and recipe on page."""
 
@@ -108,6 +119,7 @@ class SpoonacularWebRecipesTests(TestCase):
 
 class AIRecipesTests(TestCase):
     def setUp(self):
+        cache.clear()  # pantry/API/results caches persist between tests
         self.user = User.objects.create_user(username="aiuser", password="pass123")
         self.client.login(username="aiuser", password="pass123")
         Ingredient.objects.create(user=self.user, name="bell pepper")
@@ -117,8 +129,8 @@ class AIRecipesTests(TestCase):
     @patch.dict(
         "os.environ", {"OPENAI_API_KEY": "sk-test", "SPOONACULAR_API_KEY": "spoon-test"}
     )
-    @patch("core.views.requests.get")
-    @patch("core.views.requests.post")
+    @patch("core.views._SESSION.get")
+    @patch("core.views._SESSION.post")
     def test_ai_recipes_happy_path(self, mock_post, mock_get):
         """Mock OpenAI JSON + Spoonacular fallback image. Expect 200 and titles on page."""
         ai_payload = {
@@ -158,6 +170,69 @@ class AIRecipesTests(TestCase):
         self.assertContains(r, "AI Recipe Ideas")
         self.assertContains(r, "Pepper Chicken Bake")
 
+    def test_generated_image_poll_patches_stored_results(self):
+        session = self.client.session
+        session["ai_recipes"] = [{"id": 1, "title": "Pepper Bake", "image_url": None}]
+        session.save()
+        url = reverse("core:ai_recipe_image_status", args=[1]) + "?kind=food"
+        self.assertFalse(self.client.get(url).json()["pending"])
+
+        key = _title_image_cache_key("ai:img:food", "Pepper Bake")
+        cache.set(key, "https://img.test/generated.png")
+        data = self.client.get(url).json()
+        self.assertEqual(data["image_url"], "https://img.test/generated.png")
+        self.assertEqual(
+            self.client.session["ai_recipes"][0]["image_url"],
+            "https://img.test/generated.png",
+        )
+
+
+class RecipeDetailEnrichmentTests(TestCase):
+    def setUp(self):
+        cache.clear()  # results bundles live in the cache
+        self.user = User.objects.create_user(username="webuser", password="pass123")
+        self.client.login(username="webuser", password="pass123")
+        item = {"id": 4321, "title": "Bare Stew", "image": "https://img.test/s.jpg"}
+        _cache_set_results(
+            "rr:tok", {"ai": [], "web": [item], "combined": [dict(item)]}
+        )
+        session = self.client.session
+        session["recipe_results_token"] = "tok"
+        session.save()
+
+    @patch("core.views.spoonacular_recipe_info")
+    def test_web_detail_stores_enriched_ingredients(self, mock_info):
+        ings = [{"original": "2 carrots"}]
+        mock_info.return_value = {"extendedIngredients": ings}
+
+        r = self.client.get(reverse("core:recipe_detail_web", args=["4321"]))
+        self.assertEqual(r.status_code, 200)
+        self.assertContains(r, "2 carrots")
+
+        bundle = _cache_get_results("rr:tok")
+        self.assertEqual(bundle["web"][0]["extendedIngredients"], ings)
+        self.assertEqual(bundle["combined"][0]["extendedIngredients"], ings)
+
+    @patch("core.views.spoonacular_macros_for", return_value={})
+    @patch("core.views.cache_remote_image_to_storage", return_value=None)
+    @patch("core.views.spoonacular_image_for", return_value="https://img.test/ai.jpg")
+    def test_ai_detail_image_reaches_saved_favorite(self, *_mocks):
+        item = {"id": "ai-1", "title": "Pepper Rice"}
+        session = self.client.session
+        session["recipe_results"] = {"ai": [item], "web": [], "combined": [item]}
+        session.save()
+
+        r = self.client.get(reverse("core:recipe_detail_ai", args=["ai-1"]))
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(
+            self.client.session["recipe_results"]["ai"][0]["image_url"],
+            "https://img.test/ai.jpg",
+        )
+
+        self.client.post(reverse("core:save_favorite", args=["ai", "ai-1"]))
+        fav = SavedRecipe.objects.get(user=self.user, external_id="ai-1")
+        self.assertEqual(fav.image_url, "https://img.test/ai.jpg")
+
 
 class FavoritesDBDetailTests(TestCase):
     def setUp(self):
@@ -180,3 +255,140 @@ class FavoritesDBDetailTests(TestCase):
         self.assertContains(r, "Saved Pepper Chicken")
         self.assertContains(r, "Ingredients")
         self.assertContains(r, "Instructions")
+
+    def test_favorites_list_cache_dropped_on_delete(self):
+        cache.clear()
+        fav = SavedRecipe.objects.create(
+            user=self.user, source="web", external_id="77", title="Cached Curry"
+        )
+        self.assertContains(self.client.get(reverse("core:favorites")), "Cached Curry")
+
+        self.client.post(reverse("core:favorite_delete", args=[fav.pk]))
+        r = self.client.get(reverse("core:favorites"))
+        self.assertNotContains(r, "Cached Curry")
+
+    def test_saved_badge_cleared_after_last_favorite_deleted(self):
+        cache.clear()
+        item = {"id": 77, "title": "Cached Curry", "image": "https://img.test/c.jpg"}
+        session = self.client.session
+        session["recipe_results"] = {"ai": [], "web": [item], "combined": [item]}
+        session.save()
+        fav = SavedRecipe.objects.create(
+            user=self.user, source="web", external_id="77", title="Cached Curry"
+        )
+        url = reverse("core:recipes_results")
+        self.assertContains(self.client.get(url), "Saved</span>")
+
+        self.client.post(reverse("core:favorite_delete", args=[fav.pk]))
+        self.assertNotContains(self.client.get(url + "?again=1"), "Saved</span>")
+        self.assertNotIn("saved", self.client.session["recipe_results"]["combined"][0])
+
+
+class PantryExtractReviewTests(TestCase):
+    def setUp(self):
+        cache.clear()  # pantry/API/results caches persist between tests
+        self.user = User.objects.create_user(username="pantry", password="pass123")
+        self.client.login(username="pantry", password="pass123")
+        self.upload = PantryImageUpload.objects.create(
+            user=self.user, image="pantry_uploads/test.jpg"
+        )
+
+    def test_review_merges_existing_and_duplicate_rows(self):
+        Ingredient.objects.create(user=self.user, name="Onion", quantity="1")
+        data = {
+            "form-TOTAL_FORMS": "3",
+            "form-INITIAL_FORMS": "0",
+            "form-0-name": "onion",
+            "form-0-quantity": "2",
+            "form-0-unit": "",
+            "form-1-name": "Garlic",
+            "form-1-quantity": "1",
+            "form-1-unit": "clove",
+            "form-2-name": "garlic",
+            "form-2-quantity": "1",
+            "form-2-unit": "",
+        }
+        url = reverse("core:pantry_extract_review", args=[self.upload.pk])
+        r = self.client.post(url, data=data)
+        self.assertEqual(r.status_code, 302)
+
+        onion = Ingredient.objects.get(user=self.user, name__iexact="onion")
+        self.assertEqual(onion.quantity, "3")
+        garlic = Ingredient.objects.get(user=self.user, name__iexact="garlic")
+        self.assertEqual(garlic.quantity, "2")
+        self.assertEqual(garlic.unit, "clove")
+        self.assertEqual(Ingredient.objects.filter(user=self.user).count(), 2)
+
+    def test_status_endpoint_reports_pending_then_done(self):
+        url = reverse("core:pantry_extract_status", args=[self.upload.pk])
+        self.assertTrue(self.client.get(url).json()["pending"])
+
+        self.upload.status = PantryImageUpload.Status.DONE
+        self.upload.save(update_fields=["status"])
+        self.assertFalse(self.client.get(url).json()["pending"])
+
+        other = User.objects.create_user(username="other", password="pass123")
+        self.client.force_login(other)
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+
+class LooksLikeTextTests(TestCase):
+    def test_text_image_passes_and_blank_image_does_not(self):
+        from PIL import Image, ImageDraw
+
+        page = Image.new("L", (600, 800), 255)
+        draw = ImageDraw.Draw(page)
+        for i in range(12):
+            draw.text((40, 40 + i * 50), "milk  2 eggs  butter", fill=0, font_size=28)
+        self.assertTrue(_looks_like_text(page))
+        self.assertFalse(_looks_like_text(Image.new("L", (600, 800), 200)))
+
+    @patch.dict("os.environ", {"OPENAI_API_KEY": ""})
+    @patch("core.views._looks_like_text", return_value=False)
+    @patch("core.views._ocr_image_text", return_value="2 eggs")
+    def test_ocr_still_runs_when_vision_is_unavailable(self, mock_ocr, _mock_check):
+        import tempfile
+
+        from PIL import Image
+
+        cache.clear()
+        with tempfile.NamedTemporaryFile(suffix=".png") as f:
+            Image.new("L", (64, 64), 255).save(f, format="PNG")
+            f.flush()
+            with self.settings(OPENAI_API_KEY=""):
+                items = _extract_candidates(f.name, None)
+        mock_ocr.assert_called_once()
+        self.assertEqual(items, [{"name": "eggs", "quantity": "2", "unit": ""}])
+
+
+class ParseIngredientsFromTextTests(TestCase):
+    def test_parses_quantity_unit_and_name(self):
+        text = "- 200 g chicken breast\n2 bell pepper\ngarlic 3 pcs\n\n• ginger"
+        self.assertEqual(
+            _parse_ingredients_from_text(text),
+            [
+                {"name": "chicken breast", "quantity": "200", "unit": "g"},
+                {"name": "bell pepper", "quantity": "2", "unit": ""},
+                {"name": "garlic", "quantity": "3", "unit": "pcs"},
+                {"name": "ginger", "quantity": "", "unit": ""},
+            ],
+        )
+
+    def test_caps_at_fifty_items(self):
+        text = "\n".join(f"item {i}" for i in range(80))
+        self.assertEqual(len(_parse_ingredients_from_text(text)), 50)
+
+
+class HeuristicAIStepsTests(TestCase):
+    def test_compound_and_plural_titles_keep_their_category(self):
+        blend = "Add all ingredients to a blender."
+        self.assertEqual(_heuristic_ai_steps("Banana Milkshake")[0], blend)
+        self.assertEqual(
+            _heuristic_ai_steps("Avocado Toasts")[0], "Toast the bread to your liking."
+        )
+
+    def test_meatballs_are_not_energy_bites(self):
+        self.assertEqual(
+            _heuristic_ai_steps("Turkey Meatballs")[0],
+            "Prep ingredients (wash, peel, chop as needed).",
+        )
@@ -38,6 +38,18 @@ urlpatterns = [
         views.recipe_detail,
         name="recipe_detail",
     ),
+    # poll target while an AI recipe's generated image is pending
+    path(
+        "ai/recipes/<int:recipe_id>/image/",
+        views.ai_recipe_image_status,
+        name="ai_recipe_image_status",
+    ),
+    # poll target while an AI result's fallback image is looked up
+    path(
+        "recipes/<str:source>/<str:recipe_id>/image/",
+        views.recipe_image_status,
+        name="recipe_image_status",
+    ),
     # save to favorites for a session-backed result:
     path(
         "recipes/<str:source>/<slug:recipe_id>/save/",
@@ -81,6 +93,12 @@ urlpatterns = [
         views.pantry_extract_review,
         name="pantry_extract_review",
     ),
+    # poll target while a pantry photo is being extracted in the background
+    path(
+        "pantry/extract/<int:upload_id>/status/",
+        views.pantry_extract_status,
+        name="pantry_extract_status",
+    ),
     # Used by the dashboard "Upload & Review" form
     path(
         "pantry/upload-to-review/",
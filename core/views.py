@@ -12,14 +12,26 @@ import os
 import re
 import json
 import base64
+import hashlib
+import heapq
 import mimetypes
 import logging
+import math
+import secrets
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from datetime import date as _date, timedelta
+from difflib import SequenceMatcher
+from functools import lru_cache
+from io import BytesIO, StringIO
+from itertools import islice
 import datetime as dt
 from uuid import uuid4
 from pathlib import Path
 import boto3
-from typing import Optional, List
+from botocore.exceptions import NoCredentialsError
+from typing import Iterable, Optional, List
 from decimal import Decimal, InvalidOperation
 
 # ---- OCR helpers -------------------------------------------------------------
@@ -30,7 +42,13 @@ except Exception:
 
 # ---- third-party HTTP --------------------------------------------------------
 import requests
+from .services.http import POOL_MAXSIZE, SESSION as _SESSION, loads as _json_loads
+from .services.http import dumps as _json_dumps
+from .services.http import io_pool as _io_pool, response_json as _response_json
 from .services.image_lookup import spoonacular_image_for, cache_remote_image_to_storage
+from .services.image_lookup import IMAGE_LOOKUP_CACHE_TTL
+from .services.image_lookup import cached_title_image as _cached_title_image
+from .services.image_lookup import title_image_cache_key as _title_image_cache_key
 
 # ---- Django ------------------------------------------------------------------
 from django import forms
@@ -41,14 +59,15 @@ from django.contrib.auth import get_user_model, login
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
 from django.db import transaction, IntegrityError
+from django.db.models.functions import Lower
 from django.http import JsonResponse, Http404
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse
 from django.utils import timezone
 from django.views.decorators.http import require_http_methods, require_POST
+from django.core.cache import cache
 from django.core.files.storage import default_storage
 from django.core.mail import send_mail
-from django.utils.text import slugify
 
 
 # ---- App models & forms ------------------------------------------------------
@@ -69,6 +88,7 @@ from .forms import (
     PantryImageUploadForm,
 )
 
+from .services.background import run_in_background
 from .services.nutrition import (
     compute_daily_totals,
     suggest_recipes_for_gaps,
@@ -84,12 +104,23 @@ except Exception:
     OpenAI = None
 
 _openai_client = None
-if OpenAI:
-    _openai_client = OpenAI(
-        api_key=(
-            getattr(settings, "OPENAI_API_KEY", None) or os.getenv("OPENAI_API_KEY")
-        )
-    )
+_openai_key = getattr(settings, "OPENAI_API_KEY", None) or os.getenv("OPENAI_API_KEY")
+if OpenAI and _openai_key:
+    try:
+        _openai_client = OpenAI(api_key=_openai_key)
+    except Exception:  # bad key/config: run without AI recipes
+        _openai_client = None
+
+# Which text-generation endpoints this SDK version offers, resolved once so
+# _openai_generate doesn't re-probe the client on every call.
+_OPENAI_RESPONSES_CREATE = getattr(
+    getattr(_openai_client, "responses", None), "create", None
+)
+_OPENAI_CHAT_CREATE = getattr(
+    getattr(getattr(_openai_client, "chat", None), "completions", None),
+    "create",
+    None,
+)
 
 # ---- Spoonacular helpers (guarded & de-duplicated) ---------------------------
 # We prefer the project's service-layer function first, and fall back to
@@ -158,6 +189,148 @@ if pytesseract:
 # Unified recipe search helpers (single button)
 # =============================================================================
 
+# Result payloads (ingredients, instructions, nutrition) are tens of KB; they
+# live in the cache and the session only keeps a short token per payload, so
+# re-saving enriched results never rewrites the whole session row.
+RESULTS_CACHE_TTL = 60 * 60
+# Payloads are stored as zlib-compressed JSON: recipe text compresses ~5x,
+# which keeps Redis memory and per-request transfer small. Level 3 costs well
+# under a millisecond on a typical bundle.
+RESULTS_COMPRESS_LEVEL = 3
+
+
+def _pack_combined(bundle: dict) -> dict:
+    """
+    Swap `combined` entries that are the very same objects as `ai`/`web`
+    entries for ["ai"|"web", index] references. JSON has no shared objects, so
+    otherwise every recipe would be encoded (and stored) twice.
+    """
+    combined = bundle.get("combined")
+    if not isinstance(combined, list):
+        return bundle
+    where = {
+        id(it): [list_name, i]
+        for list_name in ("ai", "web")
+        for i, it in enumerate(bundle.get(list_name) or ())
+    }
+    packed = {k: v for k, v in bundle.items() if k != "combined"}
+    packed["_combined_refs"] = [where.get(id(it), it) for it in combined]
+    return packed
+
+
+def _unpack_combined(bundle: dict) -> dict:
+    """Inverse of _pack_combined(); references resolve to the shared objects."""
+    refs = bundle.pop("_combined_refs", None)
+    if refs is not None:
+        bundle["combined"] = [
+            bundle[ref[0]][ref[1]] if isinstance(ref, list) else ref for ref in refs
+        ]
+    return bundle
+
+
+def _cache_set_results(key: str, data) -> None:
+    """Store a results payload as compressed JSON (as-is if not JSON-able)."""
+    if isinstance(data, dict):
+        data = _pack_combined(data)
+    try:
+        raw = _json_dumps(data)
+    except (TypeError, ValueError):
+        packed = data
+    else:
+        packed = zlib.compress(raw, RESULTS_COMPRESS_LEVEL)
+    cache.set(key, packed, RESULTS_CACHE_TTL)
+
+
+def _cache_get_results(key: str):
+    """Inverse of _cache_set_results(); None on a miss or unreadable entry."""
+    packed = cache.get(key)
+    if not isinstance(packed, bytes):
+        return _unpack_combined(packed) if isinstance(packed, dict) else packed
+    try:
+        data = _json_loads(zlib.decompress(packed))
+    except (zlib.error, ValueError):
+        logger.warning("Dropping unreadable results entry %s", key)
+        return None
+    return _unpack_combined(data) if isinstance(data, dict) else data
+
+
+def _load_results(request, name: str, default=None):
+    """
+    Return the results payload stored under `name` for this session: from the
+    session copy kept when the cache is per-process, else from the cache,
+    falling back to payloads kept directly in older sessions. Decoded payloads
+    are memoized on the request, so repeat lookups skip the cache round trip.
+    """
+    memo = getattr(request, "_results_memo", None)
+    if memo is None:
+        memo = request._results_memo = {}
+    if name in memo:
+        data = memo[name]
+    else:
+        # Without a shared cache the session copy is the authoritative one.
+        data = None if _cache_is_shared() else request.session.get(name)
+        token = request.session.get(f"{name}_token")
+        if data is None and token:
+            data = _cache_get_results(f"rr:{token}")
+        if data is None:
+            data = request.session.get(name)
+        memo[name] = data
+    return default if data is None else data
+
+
+def _cache_is_shared() -> bool:
+    """True when every worker sees the same cache (Redis), not a per-process one."""
+    return bool(getattr(settings, "CACHE_IS_SHARED", False))
+
+
+def _store_results(request, name: str, data) -> None:
+    """
+    Cache `data` under this session's token for `name` (minted on first use).
+    With a per-process cache the session keeps a copy too, so a request served
+    by another worker (or after eviction/restart) still finds the results.
+    """
+    if name == "recipe_results" and isinstance(data, dict):
+        _index_results_bundle(data)
+    token = request.session.get(f"{name}_token")
+    if not token:
+        token = secrets.token_urlsafe(16)
+        request.session[f"{name}_token"] = token
+    if not _cache_is_shared():
+        request.session[name] = data
+    elif name in request.session:
+        del request.session[name]
+    _cache_set_results(f"rr:{token}", data)
+    memo = getattr(request, "_results_memo", None)
+    if memo is not None:
+        memo[name] = data
+
+
+def _index_results_bundle(bundle: dict) -> None:
+    """(Re)build the bundle's per-list id -> position map used by _bundle_item()."""
+    index = {}
+    for list_name in ("ai", "web", "combined"):
+        positions: dict[str, int] = {}
+        for i, it in enumerate(bundle.get(list_name) or []):
+            if isinstance(it, dict):
+                positions.setdefault(str(it.get("id")), i)
+        index[list_name] = positions
+    bundle["_id_index"] = index
+
+
+def _bundle_item(bundle: dict, list_name: str, rid: str) -> Optional[dict]:
+    """Return the entry with id `rid` from one list of a results bundle."""
+    items = bundle.get(list_name) or []
+    i = (bundle.get("_id_index") or {}).get(list_name, {}).get(rid)
+    if i is not None and i < len(items):
+        it = items[i]
+        if isinstance(it, dict) and str(it.get("id")) == rid:
+            return it
+    # Bundles stored before the index existed (or edited without it)
+    for it in items:
+        if isinstance(it, dict) and str(it.get("id")) == rid:
+            return it
+    return None
+
 
 def _stash_suggestions_in_session(request, suggestions: list[dict]) -> None:
     """
@@ -165,7 +338,7 @@ def _stash_suggestions_in_session(request, suggestions: list[dict]) -> None:
     so recipe_detail() can retrieve them by id.
     Expected suggestion fields: id, title, (optional) image.
     """
-    bundle = request.session.get("recipe_results") or {
+    bundle = _load_results(request, "recipe_results") or {
         "ai": [],
         "web": [],
         "combined": [],
@@ -194,8 +367,33 @@ def _stash_suggestions_in_session(request, suggestions: list[dict]) -> None:
         if sid not in combined_ids:
             bundle.setdefault("combined", []).append(item)
 
-    request.session["recipe_results"] = bundle
-    request.session.modified = True
+    _store_results(request, "recipe_results", bundle)
+
+
+# Pantry names are read by every search view; a short TTL bounds staleness from
+# writes that bypass _forget_pantry_names() (e.g. the admin).
+PANTRY_NAMES_CACHE_TTL = 60
+
+
+def _pantry_names(user) -> List[str]:
+    """Return the user's raw ingredient names.
+
+    Cached briefly, but only with a shared cache: a per-process one can't see
+    the invalidations made by other workers.
+    """
+    shared = _cache_is_shared()
+    key = f"pantry:{user.pk}"
+    names = cache.get(key) if shared else None
+    if names is None:
+        names = list(user.ingredients.values_list("name", flat=True))
+        if shared:
+            cache.set(key, names, PANTRY_NAMES_CACHE_TTL)
+    return names
+
+
+def _forget_pantry_names(user) -> None:
+    """Drop the cached pantry names after the user's ingredients change."""
+    cache.delete(f"pantry:{user.pk}")
 
 
 def _gather_ingredient_names(request) -> List[str]:
@@ -209,16 +407,35 @@ def _gather_ingredient_names(request) -> List[str]:
         or request.POST.getlist("ingredients")
         or request.POST.getlist("selected")
     )
-    qs = Ingredient.objects.filter(user=request.user)
     if ids:
-        qs = qs.filter(pk__in=ids)
-
-    names: List[str] = []
-    for ing in qs.only("name"):
-        n = (ing.name or "").strip()
-        if n and n.lower() not in [x.lower() for x in names]:
-            names.append(n)
-    return names
+        raw = Ingredient.objects.filter(user=request.user, pk__in=ids).values_list(
+            "name", flat=True
+        )
+    else:
+        raw = _pantry_names(request.user)
+
+    # The (user, lower(name)) unique constraint already rules out case-only
+    # duplicates in the DB; this only folds names that differ by whitespace.
+    # First spelling wins; dicts keep insertion order.
+    names: dict[str, str] = {}
+    for n in raw:
+        n = (n or "").strip()
+        if n:
+            names.setdefault(n.casefold(), n)
+    return list(names.values())
+
+
+# The parts of a complexSearch result that the detail/favorite views read back
+# from `meta`; the rest (summary HTML, diets, wine pairing...) is dropped
+# instead of riding along in the cached results bundle.
+_SPOON_META_KEYS = (
+    "sourceUrl",
+    "analyzedInstructions",
+    "instructions",
+    "extendedIngredients",
+    "readyInMinutes",
+    "servings",
+)
 
 
 def _spoonacular_search(
@@ -247,13 +464,13 @@ def _spoonacular_search(
         "apiKey": key,
     }
     try:
-        r = requests.get(
+        r = _SESSION.get(
             "https://api.spoonacular.com/recipes/complexSearch",
             params=params,
             timeout=12,
         )
         r.raise_for_status()
-        data = r.json() or {}
+        data = _response_json(r) or {}
         results = data.get("results", []) or []
         out = []
         for it in results:
@@ -263,7 +480,8 @@ def _spoonacular_search(
                     "title": it.get("title") or "Untitled",
                     "image": it.get("image"),
                     "source": "web",
-                    "meta": it,  # keep the raw payload (detail view can use it)
+                    # keep what the detail view can use
+                    "meta": {k: it[k] for k in _SPOON_META_KEYS if k in it},
                 }
             )
         return out
@@ -277,46 +495,45 @@ def _spoonacular_search(
 # --------------------------------------------------------------------------------------
 
 
+_PROTEIN_CALORIE_NAMES = frozenset({"protein", "calories"})
+
+
 def _extract_protein_and_calories(item: dict) -> tuple[int, int]:
     """
     Return (protein_g, calories) from a Spoonacular item regardless of shape.
     """
-    protein_g = 0
-    calories = 0
+
+    def _int(v) -> int:
+        try:
+            return int(round(float(v or 0)))
+        except Exception:
+            return 0
 
     # Many wrappers expose: item["nutrition"]["nutrients"] = [{name, amount, unit}, ...]
+    # (~25 entries; stop as soon as both values have been seen)
+    found = {}
     nut = (item.get("nutrition") or {}).get("nutrients", [])
     if isinstance(nut, list):
         for n in nut:
             name = (n.get("name") or "").lower()
-            if name == "protein":
-                try:
-                    protein_g = int(round(float(n.get("amount") or 0)))
-                except Exception:
-                    pass
-            if name == "calories":
-                try:
-                    calories = int(round(float(n.get("amount") or 0)))
-                except Exception:
-                    pass
+            if name in _PROTEIN_CALORIE_NAMES and name not in found:
+                found[name] = n.get("amount")
+                if len(found) == 2:
+                    break
+    protein_g = _int(found.get("protein"))
+    calories = _int(found.get("calories"))
 
     # Some wrappers flatten: item["protein"], item["calories"]
     if not protein_g:
-        try:
-            protein_g = int(round(float(item.get("protein") or 0)))
-        except Exception:
-            pass
+        protein_g = _int(item.get("protein"))
     if not calories:
-        try:
-            calories = int(round(float(item.get("calories") or 0)))
-        except Exception:
-            pass
+        calories = _int(item.get("calories"))
 
     return protein_g, calories
 
 
 def _slugify_title(title: str, ix: int = 0) -> str:
-    base = re.sub(r"[^a-z0-9]+", "-", (title or "").lower()).strip("-")
+    base = _SLUG_SEP_RE.sub("-", (title or "").lower()).strip("-")
     if not base:
         base = f"recipe-{ix+1}"
     return (base[:40] or base) if ix == 0 else f"{base[:34]}-{ix+1}"
@@ -326,17 +543,20 @@ def _normalize_keys(d: dict) -> dict:
     return {(k or "").strip().lower(): v for k, v in (d or {}).items()}
 
 
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.S)
+
+
 def _extract_json_block(text: str) -> Optional[dict]:
     if not text:
         return None
     try:
-        return json.loads(text)
+        return _json_loads(text)
     except Exception:
         pass
-    m = re.search(r"\{.*\}", text, flags=re.S)
+    m = _JSON_OBJECT_RE.search(text)
     if m:
         try:
-            return json.loads(m.group(0))
+            return _json_loads(m.group(0))
         except Exception:
             return None
     return None
@@ -368,7 +588,7 @@ def _openai_generate(ingredients: list[str], kind: str = "food") -> list[dict]:
       - Falls back to Chat Completions (adds JSON mode there).
       - Falls back to parsing a markdown table.
     """
-    if not _openai_client:
+    if not (_OPENAI_RESPONSES_CREATE or _OPENAI_CHAT_CREATE):
         logger.info("OpenAI client not available; skipping AI generation.")
         return []
 
@@ -400,10 +620,8 @@ def _openai_generate(ingredients: list[str], kind: str = "food") -> list[dict]:
 
     # --- Attempt 1: Responses API (do NOT pass response_format here) ---
     try:
-        if hasattr(_openai_client, "responses") and hasattr(
-            _openai_client.responses, "create"
-        ):
-            resp = _openai_client.responses.create(
+        if _OPENAI_RESPONSES_CREATE:
+            resp = _OPENAI_RESPONSES_CREATE(
                 model=model,
                 input=[
                     {"role": "system", "content": system_msg},
@@ -419,9 +637,7 @@ def _openai_generate(ingredients: list[str], kind: str = "food") -> list[dict]:
     # --- Attempt 2: Chat Completions (JSON mode allowed here) ---
     if not text:
         try:
-            if hasattr(_openai_client, "chat") and hasattr(
-                _openai_client.chat, "completions"
-            ):
+            if _OPENAI_CHAT_CREATE:
                 kwargs = {
                     "model": model,
                     "messages": [
@@ -434,7 +650,7 @@ def _openai_generate(ingredients: list[str], kind: str = "food") -> list[dict]:
                 except Exception:
                     pass
 
-                c = _openai_client.chat.completions.create(**kwargs)
+                c = _OPENAI_CHAT_CREATE(**kwargs)
                 text = (c.choices[0].message.content or "").strip()
         except Exception as e:
             logger.exception("Chat Completions failed: %s", e)
@@ -484,15 +700,19 @@ def _openai_generate(ingredients: list[str], kind: str = "food") -> list[dict]:
 def _combine_and_store_results(
     request, ai_items: List[dict], web_items: List[dict]
 ) -> None:
-    """Store both lists and an ordered combined view in session."""
-    combined = ai_items + web_items
-    combined.sort(key=lambda x: (0 if x["source"] == "ai" else 1, x["title"].lower()))
-    request.session["recipe_results"] = {
-        "ai": ai_items,
-        "web": web_items,
-        "combined": combined,
-    }
-    request.session.modified = True
+    """Store both lists and an ordered combined view for this session."""
+
+    def by_title(x):
+        return x["title"].casefold()
+
+    # AI first, then web, each alphabetical: the lists are already split by
+    # source, so sort them separately instead of the concatenation.
+    combined = sorted(ai_items, key=by_title) + sorted(web_items, key=by_title)
+    _store_results(
+        request,
+        "recipe_results",
+        {"ai": ai_items, "web": web_items, "combined": combined},
+    )
 
 
 # =============================================================================
@@ -500,26 +720,147 @@ def _combine_and_store_results(
 # =============================================================================
 
 
-def _ocr_extract_text(image_path: str) -> str:
+# Upload status values, resolved once (supports flat constants or a Status enum).
+_STATUS_PENDING = (
+    getattr(PantryImageUpload, "PENDING", None)
+    or getattr(getattr(PantryImageUpload, "Status", object), "PENDING", None)
+    or "pending"
+)
+_STATUS_DONE = (
+    getattr(PantryImageUpload, "DONE", None)
+    or getattr(getattr(PantryImageUpload, "Status", object), "DONE", None)
+    or "done"
+)
+_STATUS_FAILED = (
+    getattr(PantryImageUpload, "FAILED", None)
+    or getattr(getattr(PantryImageUpload, "Status", object), "FAILED", None)
+    or "failed"
+)
+
+# Concrete PantryImageUpload fields, read once instead of hasattr() per upload.
+_PIU_FIELDS = frozenset(f.name for f in PantryImageUpload._meta.concrete_fields)
+# Where _store_upload_results writes the payload, and what it saves.
+_PIU_RESULTS_FIELD = next(
+    (f for f in ("results", "results_json") if f in _PIU_FIELDS), None
+)
+_PIU_HAS_STATUS = "status" in _PIU_FIELDS
+_PIU_UPDATE_FIELDS = tuple(
+    f for f in (_PIU_RESULTS_FIELD, "status" if _PIU_HAS_STATUS else None) if f
+)
+
+# How long the review page keeps polling a pending upload before giving up.
+PANTRY_EXTRACT_POLL_WINDOW = timedelta(minutes=5)
+# Extracted candidates are kept per file-content hash for re-uploads.
+PANTRY_EXTRACT_CACHE_TTL = 24 * 60 * 60
+
+
+# Longest side (px) of images handed to Tesseract / OpenAI Vision. Phone photos
+# are 3-12 MB; Vision bills per 512px tile and base64 adds a third on the wire.
+OCR_MAX_SIDE = 2000
+VISION_MAX_SIDE = 1024
+VISION_JPEG_QUALITY = 85
+# 40 items of {"name","quantity","unit"} fit comfortably in this many tokens.
+VISION_MAX_TOKENS = 800
+
+
+def _encode_for_vision(img) -> memoryview:
     """
-    Extract raw text from an image using Tesseract if available.
-    Returns '' on failure so callers can fall back safely.
+    JPEG bytes of a PIL image, downscaled to VISION_MAX_SIDE. Returned as a view
+    of the encode buffer (b64encode takes it as-is), saving a copy of the image.
+    """
+    from PIL import Image
+
+    small = img.convert("RGB")  # always a copy, so the caller's image is untouched
+    small.thumbnail((VISION_MAX_SIDE, VISION_MAX_SIDE), Image.LANCZOS)
+    buf = BytesIO()
+    small.save(buf, format="JPEG", quality=VISION_JPEG_QUALITY, optimize=True)
+    return buf.getbuffer()
+
+
+def _image_bytes_for_vision(image_path: str) -> tuple[bytes | memoryview, str]:
+    """
+    Return (bytes, mime) for a Vision upload: downscaled to VISION_MAX_SIDE
+    and re-encoded as JPEG when Pillow is available, else the file as-is.
     """
     try:
-        import pytesseract
+        from PIL import Image, ImageOps
+
+        with Image.open(image_path) as img:
+            # Re-encoding drops EXIF: bake the camera orientation into the pixels
+            return _encode_for_vision(ImageOps.exif_transpose(img)), "image/jpeg"
     except ImportError:
-        logger.info("pytesseract not installed; skipping OCR.")
-        return ""
+        pass
+    except Exception:
+        logger.warning("Could not downscale %s; sending original.", image_path)
+    with open(image_path, "rb") as f:
+        return f.read(), mimetypes.guess_type(image_path)[0] or "image/jpeg"
+
 
+def _prepare_image(image_path: str):
+    """
+    Decode an upload once for the whole extraction pipeline.
+    Returns (gray, vision): a grayscale PIL image capped at OCR_MAX_SIDE for the
+    text check and OCR, and (bytes, mime) for Vision. gray is None when Pillow
+    is missing or can't read the file (vision then falls back to the raw file,
+    or is None too if the file can't be opened at all).
+    """
     try:
-        from PIL import Image
+        from PIL import Image, ImageOps
+
+        with Image.open(image_path) as img:
+            # Let the JPEG decoder scale down while decoding (no-op otherwise).
+            img.draft("RGB", (OCR_MAX_SIDE, OCR_MAX_SIDE))
+            # Re-encoding drops EXIF: bake the camera orientation into the
+            # pixels so Vision and OCR see portrait photos upright.
+            rgb = ImageOps.exif_transpose(img).convert("RGB")
+        rgb.thumbnail((OCR_MAX_SIDE, OCR_MAX_SIDE))
+        return rgb.convert("L"), (_encode_for_vision(rgb), "image/jpeg")
     except ImportError:
-        logger.info("Pillow (PIL) not installed; skipping OCR.")
-        return ""
+        pass
+    except Exception:
+        logger.warning("Could not decode %s for extraction.", image_path)
+    try:
+        return None, _image_bytes_for_vision(image_path)
+    except OSError:
+        return None, None
+
 
+# Text pre-check for OCR: share of strong-edge pixels in a small grayscale copy.
+# Receipts and labels are dense with glyph edges; plain pantry shots mostly aren't.
+TEXT_CHECK_SIDE = 256
+TEXT_EDGE_LEVEL = 64
+TEXT_EDGE_MIN_FRACTION = 0.02
+
+
+def _looks_like_text(gray) -> bool:
+    """
+    Cheap heuristic on a grayscale PIL image: enough edge detail to be worth OCR?
+    Errs on the side of True.
+    """
     try:
-        with Image.open(image_path) as img:
-            return pytesseract.image_to_string(img)
+        from PIL import ImageFilter
+
+        small = gray.copy()
+        small.thumbnail((TEXT_CHECK_SIDE, TEXT_CHECK_SIDE))
+        edges = small.filter(ImageFilter.FIND_EDGES)
+        # FIND_EDGES lights up the 1px frame even on a blank image: ignore it
+        edges = edges.crop((1, 1, edges.width - 1, edges.height - 1))
+        strong = sum(edges.histogram()[TEXT_EDGE_LEVEL:])
+        return strong >= TEXT_EDGE_MIN_FRACTION * edges.width * edges.height
+    except Exception:
+        return True
+
+
+def _ocr_image_text(gray) -> str:
+    """
+    Extract raw text from a grayscale PIL image using Tesseract if available.
+    Returns '' on failure so callers can fall back safely.
+    """
+    if pytesseract is None:
+        logger.info("pytesseract not installed; skipping OCR.")
+        return ""
+    try:
+        return pytesseract.image_to_string(gray)
     except pytesseract.TesseractNotFoundError:
         logger.info("Tesseract binary not installed; skipping OCR.")
         return ""
@@ -531,53 +872,78 @@ def _ocr_extract_text(image_path: str) -> str:
 # Patterns used by _parse_ingredients_from_text
 _NUM_RE = r"(\d+(?:\.\d+)?)"
 _UNIT_RE = r"(g|kg|mg|ml|l|tbsp|tsp|teaspoons?|tablespoons?|cup|cups|oz|ounce|ounces|lb|lbs|pound|pounds|pc|pcs|piece|pieces|can|cans|pack|packs)"
+_QTY_UNIT_NAME_RE = re.compile(rf"^{_NUM_RE}\s+{_UNIT_RE}\s+(.+)$", re.I)
+_QTY_NAME_RE = re.compile(rf"^{_NUM_RE}\s+(.+)$", re.I)
+_NAME_QTY_UNIT_RE = re.compile(rf"^(.+?)\s+{_NUM_RE}\s+{_UNIT_RE}$", re.I)
 
 
-def _parse_ingredients_from_text(text: str) -> List[dict]:
+def _parse_ingredients_from_text(text: str | Iterable[str]) -> List[dict]:
     """
-    Parse grocery-ish lines into [{'name','quantity','unit'}].
+    Parse grocery-ish lines (a string or any iterable of lines) into
+    [{'name','quantity','unit'}].
     Accepts formats like:
       - '2 bell pepper'
       - '200 g chicken breast'
       - 'onion 1 pc'
       - 'ginger'
     """
+    # Walk a string line by line instead of materializing splitlines().
+    lines = StringIO(text, newline=None) if isinstance(text, str) else text
     items: List[dict] = []
-    for raw in text.splitlines():
-        line = raw.strip("•-* \t").strip()
+    for raw in lines:
+        # Callers only keep the first 50 items; stop parsing there.
+        if len(items) >= 50:
+            break
+
+        line = raw.strip("•-* \t\r\n\f\v")
         if not line:
             continue
 
-        # 1) "200 g chicken breast"
-        m = re.match(rf"^{_NUM_RE}\s+{_UNIT_RE}\s+(.+)$", line, flags=re.I)
-        if m:
-            qty = re.findall(_NUM_RE, line, flags=re.I)[0]
-            unit = re.findall(_UNIT_RE, line, flags=re.I)[0]
-            name = m.group(1).strip()
-            items.append({"name": name, "quantity": qty, "unit": unit})
-            continue
+        # Patterns 1 and 2 need a leading digit and pattern 3 a trailing unit
+        # letter, so check those characters before running any regex.
+        if line[0].isdigit():
+            # 1) "200 g chicken breast"
+            m = _QTY_UNIT_NAME_RE.match(line)
+            if m:
+                qty, unit, name = m.groups()
+                items.append({"name": name, "quantity": qty, "unit": unit})
+                continue
 
-        # 2) "2 bell pepper"
-        m = re.match(rf"^{_NUM_RE}\s+(.+)$", line, flags=re.I)
-        if m:
-            qty = re.findall(_NUM_RE, line, flags=re.I)[0]
-            name = m.group(1).strip()
-            items.append({"name": name, "quantity": qty, "unit": ""})
-            continue
+            # 2) "2 bell pepper"
+            m = _QTY_NAME_RE.match(line)
+            if m:
+                qty, name = m.groups()
+                items.append({"name": name, "quantity": qty, "unit": ""})
+                continue
 
         # 3) "onion 1 pc"
-        m = re.match(rf"^(.+?)\s+{_NUM_RE}\s+{_UNIT_RE}$", line, flags=re.I)
+        m = _NAME_QTY_UNIT_RE.match(line) if line[-1].isalpha() else None
         if m:
-            name = m.group(1).strip()
-            qty = re.findall(_NUM_RE, line, flags=re.I)[0]
-            unit = re.findall(_UNIT_RE, line, flags=re.I)[0]
+            name, qty, unit = m.groups()
             items.append({"name": name, "quantity": qty, "unit": unit})
             continue
 
         # Fallback: treat the line as a name-only ingredient
         items.append({"name": line, "quantity": "", "unit": ""})
 
-    return items[:50]
+    return items
+
+
+def _normalize_vision_items(items, limit: int = 40) -> List[dict]:
+    """
+    Normalize Vision JSON items into [{'name','quantity','unit'}],
+    skipping unnamed entries and keeping at most `limit` items.
+    """
+    named = (
+        {
+            "name": name,
+            "quantity": str(it.get("quantity") or "").strip(),
+            "unit": str(it.get("unit") or "").strip(),
+        }
+        for it in items or []
+        if isinstance(it, dict) and (name := str(it.get("name") or "").strip())
+    )
+    return list(islice(named, limit))
 
 
 def _extract_with_openai_vision(image_url: str) -> List[dict]:
@@ -591,6 +957,7 @@ def _extract_with_openai_vision(image_url: str) -> List[dict]:
         payload = {
             "model": "gpt-4o-mini",
             "temperature": 0.2,
+            "max_tokens": VISION_MAX_TOKENS,
             "response_format": {"type": "json_object"},
             "messages": [
                 {
@@ -610,7 +977,7 @@ def _extract_with_openai_vision(image_url: str) -> List[dict]:
                 },
             ],
         }
-        r = requests.post(
+        r = _SESSION.post(
             "https://api.openai.com/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -622,32 +989,25 @@ def _extract_with_openai_vision(image_url: str) -> List[dict]:
         if r.status_code != 200:
             logger.warning("OpenAI Vision non-200: %s %s", r.status_code, r.text[:200])
             return []
-        data = r.json()
+        data = _response_json(r)
         raw = (data["choices"][0]["message"]["content"] or "").strip()
-        obj = json.loads(raw)
-        items = obj.get("items") or []
-        out = []
-        for it in items:
-            name = (it.get("name") or "").strip()
-            if not name:
-                continue
-            out.append(
-                {
-                    "name": name,
-                    "quantity": (it.get("quantity") or "").strip(),
-                    "unit": (it.get("unit") or "").strip(),
-                }
-            )
+        out = _normalize_vision_items(_json_loads(raw).get("items"))
         logger.info("Vision(URL) extracted %d items.", len(out))
-        return out[:40]
+        return out
     except Exception:
         logger.exception("OpenAI Vision(URL) failed.")
         return []
 
 
-def _vision_extract_items_with_openai(image_path: str) -> List[dict]:
+def _vision_extract_items_with_openai(
+    image_path: str,
+    image: Optional[tuple[bytes | memoryview, str]] = None,
+    detail: str = "auto",
+) -> List[dict]:
     """
     Vision via Chat Completions (base64 data URL).
+    `image` is an already prepared (bytes, mime) pair; else image_path is read.
+    `detail` is passed through to OpenAI ("low" = one 512px tile, "high" = tiled).
     Avoids Responses API types that caused 400s/TypeError on some SDK versions.
     """
     api_key = os.getenv("OPENAI_API_KEY") or getattr(settings, "OPENAI_API_KEY", "")
@@ -655,14 +1015,16 @@ def _vision_extract_items_with_openai(image_path: str) -> List[dict]:
         logger.info("OpenAI client not available; skipping Vision.")
         return []
     try:
-        with open(image_path, "rb") as f:
-            b64 = base64.b64encode(f.read()).decode("utf-8")
-        mime = mimetypes.guess_type(image_path)[0] or "image/jpeg"
-        data_url = f"data:{mime};base64,{b64}"
+        # Encode the (downscaled) JPEG straight into the data URL and drop our
+        # reference to the raw bytes before the request body is built.
+        raw_bytes, mime = image or _image_bytes_for_vision(image_path)
+        data_url = f"data:{mime};base64,{base64.b64encode(raw_bytes).decode('ascii')}"
+        del raw_bytes
 
         payload = {
             "model": "gpt-4o-mini",
             "temperature": 0.2,
+            "max_tokens": VISION_MAX_TOKENS,
             "response_format": {"type": "json_object"},
             "messages": [
                 {
@@ -677,13 +1039,16 @@ def _vision_extract_items_with_openai(image_path: str) -> List[dict]:
                     "role": "user",
                     "content": [
                         {"type": "text", "text": "Extract up to 40 items."},
-                        {"type": "image_url", "image_url": {"url": data_url}},
+                        {
+                            "type": "image_url",
+                            "image_url": {"url": data_url, "detail": detail},
+                        },
                     ],
                 },
             ],
         }
 
-        r = requests.post(
+        r = _SESSION.post(
             "https://api.openai.com/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -697,20 +1062,8 @@ def _vision_extract_items_with_openai(image_path: str) -> List[dict]:
                 "OpenAI Vision(base64) non-200: %s %s", r.status_code, r.text[:200]
             )
             return []
-        raw = (r.json()["choices"][0]["message"]["content"] or "").strip()
-        data = json.loads(raw)
-        out = []
-        for it in data.get("items", []):
-            name = (it.get("name") or "").strip()
-            if not name:
-                continue
-            out.append(
-                {
-                    "name": name,
-                    "quantity": (it.get("quantity") or "").strip(),
-                    "unit": (it.get("unit") or "").strip(),
-                }
-            )
+        raw = (_response_json(r)["choices"][0]["message"]["content"] or "").strip()
+        out = _normalize_vision_items(_json_loads(raw).get("items"))
         logger.info("Vision(base64) extracted %d items.", len(out))
         return out
     except Exception:
@@ -718,28 +1071,89 @@ def _vision_extract_items_with_openai(image_path: str) -> List[dict]:
         return []
 
 
-def _extract_candidates(image_path: str, image_url: Optional[str]) -> List[dict]:
+def _image_digest(image_path: str) -> Optional[str]:
+    """Content hash of an uploaded file (None if it can't be read)."""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(image_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _extract_candidates(
+    image_path: Optional[str], image_url: Optional[str]
+) -> List[dict]:
     """
-    1) OCR (Tesseract)
+    0) Earlier result for the same file contents, if cached
+    1) OCR (Tesseract), unless the photo shows no text-like detail and
+       Vision is available
     2) Vision (base64 → Chat Completions)
     3) Vision (URL → Chat Completions)
     4) Tiny demo list if still empty
     """
-    text = _ocr_extract_text(image_path)
+    # Re-uploads of the same photo (retries, re-reviews) reuse the last result.
+    digest = _image_digest(image_path) if image_path else None
+    cache_key = f"pantry_extract:{digest}" if digest else None
+    if cache_key:
+        cached = cache.get(cache_key)
+        if cached:
+            return cached
+
+    # Decode + downscale once; the text check, OCR and Vision share the result.
+    # No local file (e.g. S3 storage) leaves only the URL-based Vision call.
+    gray, vision_image = _prepare_image(image_path) if image_path else (None, None)
+
+    # Plain pantry shots are a coarse task: Vision reads them at "low" detail.
+    # Receipts/labels keep "high" so small print stays legible.
+    looks_text = gray is None or _looks_like_text(gray)
+    detail = "auto" if gray is None else ("high" if looks_text else "low")
+    # Skipping OCR is only a shortcut to Vision: without an API key, OCR is the
+    # only reader left, so always give it a try.
+    vision_ready = bool(
+        os.getenv("OPENAI_API_KEY") or getattr(settings, "OPENAI_API_KEY", "")
+    )
+
+    # Optionally start the (slow) Vision call alongside OCR so an empty OCR
+    # result doesn't add its full latency. Off by default: it spends a Vision
+    # request on every upload, even when OCR alone is enough.
+    vision_fut = None
+    if image_path and getattr(settings, "PANTRY_EXTRACT_PARALLEL", False):
+        vision_fut = _io_pool().submit(
+            _vision_extract_items_with_openai, image_path, vision_image, detail
+        )
+
+    text = ""
+    if gray is not None and (looks_text or not vision_ready):
+        text = _ocr_image_text(gray)
+    elif gray is not None:
+        logger.info("No text-like detail in %s; skipping OCR.", image_path)
+    del gray
     candidates = _parse_ingredients_from_text(text) if text else []
 
-    if not candidates:
-        candidates = _vision_extract_items_with_openai(image_path)
+    if vision_fut is not None:
+        if candidates:
+            vision_fut.cancel()  # no-op if it already started
+        else:
+            candidates = _future_result(vision_fut, 90, "Vision")
+    elif not candidates and image_path:
+        candidates = _vision_extract_items_with_openai(
+            image_path, vision_image, detail
+        )
     if not candidates and image_url:
         candidates = _extract_with_openai_vision(image_url)
 
     if not candidates:
         logger.info("No items detected; using small demo list.")
-        candidates = [
+        return [
             {"name": "bell pepper", "quantity": "2", "unit": "pcs"},
             {"name": "chicken breast", "quantity": "200", "unit": "g"},
             {"name": "onion", "quantity": "1", "unit": "pc"},
         ]
+    if cache_key:
+        cache.set(cache_key, candidates, PANTRY_EXTRACT_CACHE_TTL)
     return candidates
 
 
@@ -748,37 +1162,50 @@ def _store_upload_results(upload: PantryImageUpload, candidates: List[dict]) ->
     Store results into either 'results' or 'results_json' (depending on your model),
     and set a status if present.
     """
-    payload = {"candidates": candidates}
-    if hasattr(upload, "results"):
-        upload.results = payload
-    elif hasattr(upload, "results_json"):
-        upload.results_json = payload
-    if hasattr(upload, "status"):
-        try:
-            done = (
-                getattr(PantryImageUpload, "DONE", None)
-                or getattr(getattr(PantryImageUpload, "Status", object), "DONE", None)
-                or "done"
-            )
-            upload.status = done
-        except Exception:
-            pass
-    upload.save(
-        update_fields=[
-            f for f in ("results", "results_json", "status") if hasattr(upload, f)
-        ]
-    )
+    if _PIU_RESULTS_FIELD:
+        setattr(upload, _PIU_RESULTS_FIELD, {"candidates": candidates})
+    if _PIU_HAS_STATUS:
+        upload.status = _STATUS_DONE
+    upload.save(update_fields=_PIU_UPDATE_FIELDS)
+
+
+def _run_pantry_extraction(
+    upload_id: int, image_path: Optional[str], image_url: Optional[str]
+) -> None:
+    """
+    Background job: run OCR/Vision for an upload and store the candidates.
+    Marks the upload as failed if extraction blows up so the review page stops polling.
+    """
+    up = PantryImageUpload.objects.filter(pk=upload_id).first()
+    if up is None:
+        return
+    try:
+        candidates = _extract_candidates(image_path=image_path, image_url=image_url)
+    except Exception:
+        logger.exception("Pantry extraction failed for upload %s.", upload_id)
+        up.status = _STATUS_FAILED
+        up.save(update_fields=["status"])
+        return
+    _store_upload_results(up, candidates)
 
 
 # =============================================================================
 # Loose matching + recipe helpers (existing)
 # =============================================================================
+# slugify / is_match / _normalize_ingredient are pure str -> value helpers that
+# see the same titles and pantry names over and over, so they are memoized.
 
 
+_SLUG_SEP_RE = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=2048)
 def slugify(title: str) -> str:
-    s = (title or "").strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    return re.sub(r"-+", "-", s).strip("-") or "recipe"
+    # ASCII-only on purpose: cheaper than django.utils.text.slugify and matches
+    # the slugs Spoonacular uses in its recipe URLs. One pass already collapses
+    # runs of separators.
+    s = _SLUG_SEP_RE.sub("-", (title or "").strip().lower())
+    return s.strip("-") or "recipe"
 
 
 SYNONYMS = {
@@ -806,6 +1233,31 @@ SYNONYMS = {
 }
 
 
+def _required_word(pat: str) -> str:
+    """
+    Longest plain word a SYNONYMS pattern cannot match without, used as a
+    cheap `in` pre-check ("" when the pattern has alternatives).
+    """
+    if "|" in pat:
+        return ""
+    words = re.findall(r"[a-z]+", re.sub(r"\\[bs]|\(s\)\?|s\?", " ", pat))
+    return max(words, key=len, default="")
+
+
+# name -> ((required word, compiled pattern), ...)
+_SYNONYM_PATTERNS = {
+    name: tuple((_required_word(pat), re.compile(pat)) for pat in pats)
+    for name, pats in SYNONYMS.items()
+}
+
+
+@lru_cache(maxsize=1024)
+def _word_re(word: str) -> re.Pattern:
+    """Compiled whole-word pattern for `word` (pantry names repeat constantly)."""
+    return re.compile(rf"\b{re.escape(word)}\b")
+
+
+@lru_cache(maxsize=8192)
 def is_match(pantry_item: str, candidate: str) -> bool:
     p = (pantry_item or "").strip().lower()
     c = (candidate or "").strip().lower()
@@ -813,38 +1265,84 @@ def is_match(pantry_item: str, candidate: str) -> bool:
         return False
     if p == c:
         return True
-    if re.search(rf"\b{re.escape(p)}\b", c):
+    # Most pairs share no text at all: a substring test settles them without
+    # running the regex engine.
+    if p in c and _word_re(p).search(c):
         return True
-    if re.search(rf"\b{re.escape(c)}\b", p):
+    if c in p and _word_re(c).search(p):
         return True
-    for pat in SYNONYMS.get(p, []):
-        if re.search(pat, c):
+    for word, pat in _SYNONYM_PATTERNS.get(p, ()):
+        if word in c and pat.search(c):
             return True
     return False
 
 
+# (literal trigger, compiled pattern, replacement): the cheap substring check
+# skips the regex engine for the vast majority of names that need no fix.
+_INGREDIENT_FIXES = (
+    ("peper", re.compile(r"\bbell\s*peper\b"), "bell pepper"),
+    ("corn", re.compile(r"\bsweet\s*corn\b"), "corn"),
+    ("scallion", re.compile(r"\bscallions?\b"), "green onion"),
+)
+
+
+@lru_cache(maxsize=4096)
 def _normalize_ingredient(name: str) -> str:
     n = (name or "").strip().lower()
-    fixes = {
-        r"\bbell\s*peper\b": "bell pepper",
-        r"\bsweet\s*corn\b": "corn",
-        r"\bscallions?\b": "green onion",
-    }
-    for pat, repl in fixes.items():
-        n = re.sub(pat, repl, n)
+    for trigger, pat, repl in _INGREDIENT_FIXES:
+        if trigger in n:
+            n = pat.sub(repl, n)
     return n
 
 
+def _pantry_cache_key(namespace: str, names, *parts: str) -> str:
+    """
+    Stable cache key for a pantry: insensitive to order, casing, duplicates
+    and the spelling fixes applied by _normalize_ingredient.
+    """
+    norm = sorted({_normalize_ingredient(n) for n in names if n and n.strip()})
+    raw = "|".join(parts) + "||" + ",".join(norm)
+    return f"{namespace}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
 def _get_session_recipe(source: str, rid_any, request) -> Optional[dict]:
     """
     Look up a recipe by ID (string compare) from session-stored results.
     Works for both AI slugs and numeric Spoonacular IDs.
     """
     rid = str(rid_any)
-    for item in _get_session_list_for_source(request, source):
-        if str(item.get("id")) == rid:
-            return item
-    return None
+    bundle = _load_results(request, "recipe_results", {})
+    if bundle.get(source):
+        item = _bundle_item(bundle, source, rid)
+    else:
+        # Legacy per-source lists (no id index); the bundle load above is memoized.
+        item = next(
+            (
+                it
+                for it in _get_session_list_for_source(request, source)
+                if str(it.get("id")) == rid
+            ),
+            None,
+        )
+    if item is not None and not (item.get("image_url") or item.get("image")):
+        _apply_thumb_overlay(request, item)
+    return item
+
+
+def _apply_thumb_overlay(request, item: dict) -> None:
+    """
+    Give `item` the thumbnail recipes_results found for its title (kept in the
+    rr:thumbs:<token> overlay), so detail and save use the same image the grid
+    showed instead of looking one up again.
+    """
+    token = request.session.get("recipe_results_token")
+    title = (item.get("title") or item.get("name") or "").strip()
+    if not (token and title):
+        return
+    url = (cache.get(f"rr:thumbs:{token}") or {}).get(title)
+    if url:
+        item["image_url"] = url
+        item["image"] = url
 
 
 def _get_session_list_for_source(request, source: str) -> list[dict]:
@@ -852,19 +1350,19 @@ def _get_session_list_for_source(request, source: str) -> list[dict]:
     Returns the list of results for the given source from session.
     Supports the new combined structure and legacy keys.
     """
-    bundle = request.session.get("recipe_results") or {}
+    bundle = _load_results(request, "recipe_results", {})
     if source == "ai":
         return (
             bundle.get("ai")
             or request.session.get("recipes_results_ai", [])
-            or request.session.get("ai_recipes", [])
+            or _load_results(request, "ai_recipes", [])
             or []
         )
     if source == "web":
         return (
             bundle.get("web")
             or request.session.get("recipes_results_web", [])
-            or request.session.get("web_recipes", [])
+            or _load_results(request, "web_recipes", [])
             or []
         )
     return []
@@ -934,6 +1432,7 @@ def add_ingredient(request):
         obj.user = request.user
         try:
             obj.save()
+            _forget_pantry_names(request.user)
             messages.success(request, f"Added {obj.name}.")
         except Exception as e:
             logger.exception("Could not save ingredient.")
@@ -948,6 +1447,7 @@ def add_ingredient(request):
 def delete_ingredient(request, pk: int):
     ing = get_object_or_404(Ingredient, pk=pk, user=request.user)
     ing.delete()
+    _forget_pantry_names(request.user)
     messages.info(request, f"Removed {ing.name}.")
     return redirect("core:dashboard")
 
@@ -957,6 +1457,76 @@ def delete_ingredient(request, pk: int):
 # =============================================================================
 
 
+# Boto3 client construction parses the service model JSON and resolves
+# credentials, which is far too slow to repeat per request. Build the client
+# once per process (per region) and share it; botocore clients are thread-safe.
+_S3_CLIENT = None
+_S3_CLIENT_REGION = None
+_S3_CLIENT_LOCK = threading.Lock()
+
+
+def _get_s3_client(region: str):
+    """
+    Return the shared S3 client for `region`, creating it on first use.
+    Returns None if boto3 cannot find any credentials.
+    """
+    global _S3_CLIENT, _S3_CLIENT_REGION
+    client = _S3_CLIENT
+    if client is not None and _S3_CLIENT_REGION == region:
+        return client
+
+    with _S3_CLIENT_LOCK:
+        if _S3_CLIENT is not None and _S3_CLIENT_REGION == region:
+            return _S3_CLIENT
+
+        # Try explicit env keys first (handy for local .env); otherwise let
+        # boto3's default provider chain load credentials (AWS CLI profile, EC2/ECS role, etc.)
+        ak = os.getenv("AWS_ACCESS_KEY_ID") or getattr(
+            settings, "AWS_ACCESS_KEY_ID", None
+        )
+        sk = os.getenv("AWS_SECRET_ACCESS_KEY") or getattr(
+            settings, "AWS_SECRET_ACCESS_KEY", None
+        )
+
+        if ak and sk:
+            session = boto3.Session(
+                aws_access_key_id=ak,
+                aws_secret_access_key=sk,
+                region_name=region,
+            )
+        else:
+            session = boto3.Session(region_name=region)
+
+        # Don't cache a client that can't sign anything; retry on the next request.
+        if session.get_credentials() is None:
+            return None
+
+        _S3_CLIENT = session.client("s3")
+        _S3_CLIENT_REGION = region
+        return _S3_CLIENT
+
+
+def _reset_s3_client() -> None:
+    """Drop the cached S3 client so credentials are re-resolved on next use."""
+    global _S3_CLIENT, _S3_CLIENT_REGION
+    with _S3_CLIENT_LOCK:
+        _S3_CLIENT = None
+        _S3_CLIENT_REGION = None
+
+
+def _missing_aws_credentials_response() -> JsonResponse:
+    # If boto3 still can’t find any creds, fail gracefully
+    return JsonResponse(
+        {
+            "error": (
+                "AWS credentials not found on server. "
+                "Set AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY (or configure an AWS profile/role)."
+            )
+        },
+        status=500,
+    )
+
+
 @login_required
 @require_http_methods(["POST"])
 def presign_s3_upload(request):
@@ -1001,37 +1571,10 @@ def presign_s3_upload(request):
             status=500,
         )
 
-    # ---- 3) Build a boto3 session and verify credentials exist ----
-    #
-    # Try explicit env keys first (handy for local .env); otherwise let
-    # boto3's default provider chain load credentials (AWS CLI profile, EC2/ECS role, etc.)
-    ak = os.getenv("AWS_ACCESS_KEY_ID") or getattr(settings, "AWS_ACCESS_KEY_ID", None)
-    sk = os.getenv("AWS_SECRET_ACCESS_KEY") or getattr(
-        settings, "AWS_SECRET_ACCESS_KEY", None
-    )
-
-    if ak and sk:
-        session = boto3.Session(
-            aws_access_key_id=ak,
-            aws_secret_access_key=sk,
-            region_name=region,
-        )
-    else:
-        session = boto3.Session(region_name=region)
-
-    # If boto3 still can’t find any creds, fail gracefully
-    if session.get_credentials() is None:
-        return JsonResponse(
-            {
-                "error": (
-                    "AWS credentials not found on server. "
-                    "Set AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY (or configure an AWS profile/role)."
-                )
-            },
-            status=500,
-        )
-
-    s3 = session.client("s3")
+    # ---- 3) Reuse the process-wide S3 client (credentials resolved once) ----
+    s3 = _get_s3_client(region)
+    if s3 is None:
+        return _missing_aws_credentials_response()
 
     # ---- 4) Presign a POST policy for the browser ----
     fields = {"Content-Type": content_type}
@@ -1041,13 +1584,18 @@ def presign_s3_upload(request):
         # You can add more constraints here (e.g., starts-with $key, etc.)
     ]
 
-    resp = s3.generate_presigned_post(
-        Bucket=bucket,
-        Key=key,
-        Fields=fields,
-        Conditions=conditions,
-        ExpiresIn=300,  # URL valid for 5 minutes
-    )
+    try:
+        resp = s3.generate_presigned_post(
+            Bucket=bucket,
+            Key=key,
+            Fields=fields,
+            Conditions=conditions,
+            ExpiresIn=300,  # URL valid for 5 minutes
+        )
+    except NoCredentialsError:
+        # Credentials went away (rotated role, cleared env): re-resolve next time.
+        _reset_s3_client()
+        return _missing_aws_credentials_response()
 
     # ---- 5) Return the policy + upload URL to the browser ----
     return JsonResponse(
@@ -1063,6 +1611,9 @@ def pantry_extract_start(request):
     Two modes:
     - Legacy: multipart file in request.FILES['upload']
     - Direct-to-S3: request.POST['s3_key'] from the browser after a presigned upload
+
+    Extraction (OCR + Vision) runs in the background; the review page polls the
+    upload's status until candidates are stored.
     """
     uploaded = request.FILES.get("upload")
     s3_key = (request.POST.get("s3_key") or "").strip()
@@ -1072,14 +1623,7 @@ def pantry_extract_start(request):
         return redirect("core:dashboard")
 
     up = PantryImageUpload(user=request.user)
-    try:
-        up.status = (
-            getattr(PantryImageUpload, "PENDING", None)
-            or getattr(getattr(PantryImageUpload, "Status", object), "PENDING", None)
-            or "pending"
-        )
-    except Exception:
-        pass
+    up.status = _STATUS_PENDING
 
     if uploaded:
         # write via default storage (S3 in prod, filesystem in dev)
@@ -1104,8 +1648,8 @@ def pantry_extract_start(request):
     except Exception:
         img_path = None
 
-    candidates = _extract_candidates(image_path=img_path, image_url=img_url)
-    _store_upload_results(up, candidates)
+    # OCR + Vision can take tens of seconds; the review page polls until done.
+    run_in_background(_run_pantry_extraction, up.pk, img_path, img_url)
 
     return redirect("core:pantry_extract_review", upload_id=up.pk)
 
@@ -1123,12 +1667,15 @@ def pantry_upload_quick(request):
 
     up = form.save(commit=False)
     up.user = request.user
+    up.status = _STATUS_PENDING
     up.save()
 
-    candidates = _extract_candidates(
-        up.image.path, request.build_absolute_uri(up.image.url)
+    run_in_background(
+        _run_pantry_extraction,
+        up.pk,
+        up.image.path,
+        request.build_absolute_uri(up.image.url),
     )
-    _store_upload_results(up, candidates)
 
     return redirect("core:pantry_extract_review", upload_id=up.pk)
 
@@ -1142,6 +1689,16 @@ def pantry_extract_review(request, upload_id: int):
     """
     up = get_object_or_404(PantryImageUpload, pk=upload_id, user=request.user)
 
+    # Extraction runs in the background; keep polling while it's still fresh.
+    if (
+        request.method == "GET"
+        and up.status == _STATUS_PENDING
+        and up.created_at >= timezone.now() - PANTRY_EXTRACT_POLL_WINDOW
+    ):
+        return render(
+            request, "core/pantry_review.html", {"upload": up, "processing": True}
+        )
+
     # Load saved candidates from either .results or .results_json
     raw = (
         up.results
@@ -1150,7 +1707,7 @@ def pantry_extract_review(request, upload_id: int):
     )
     if isinstance(raw, str):
         try:
-            data = json.loads(raw) or {}
+            data = _json_loads(raw) or {}
         except json.JSONDecodeError:
             data = {}
     elif isinstance(raw, dict):
@@ -1216,9 +1773,9 @@ def pantry_extract_review(request, upload_id: int):
     if request.method == "POST":
         formset = ReviewSet(request.POST)
         if formset.is_valid():
-            added = 0
-            updated = 0
-
+            # Collapse the formset into one entry per case-insensitive name so
+            # duplicates in the same submission merge instead of colliding.
+            rows: dict[str, dict] = {}
             for row in formset.cleaned_data:
                 if not row or row.get("DELETE"):
                     continue
@@ -1230,41 +1787,81 @@ def pantry_extract_review(request, upload_id: int):
                 qty_dec = _to_decimal(row.get("quantity"))
                 unit_val = (row.get("unit") or "").strip()
 
-                # For UPDATE: only update unit if provided (keep existing otherwise)
-                # For CREATE: ensure non-null unit using default 'pcs'
-                create_unit = unit_val or "pcs"
+                entry = rows.get(name.lower())
+                if entry is None:
+                    rows[name.lower()] = {
+                        "name": name,
+                        "quantity": qty_dec,
+                        "unit": unit_val,
+                    }
+                    continue
+                if qty_dec is not None:
+                    entry["quantity"] = (entry["quantity"] or Decimal("0")) + qty_dec
+                if unit_val:
+                    entry["unit"] = unit_val
+                entry["name"] = name
 
-                try:
-                    with transaction.atomic():
-                        try:
-                            obj = Ingredient.objects.select_for_update().get(
-                                user=request.user, name__iexact=name
-                            )
-                            # Merge quantity
-                            if qty_dec is not None:
-                                obj.quantity = (obj.quantity or Decimal("0")) + qty_dec
-                            # Update unit only if user provided one
-                            if unit_val:
-                                obj.unit = unit_val
-                            # Keep normalized name casing if you want
-                            obj.name = name or obj.name
-                            obj.save()
-                            updated += 1
-                        except Ingredient.DoesNotExist:
-                            Ingredient.objects.create(
-                                user=request.user,
-                                name=name,
-                                quantity=qty_dec,  # can be None if your field allows NULL
-                                unit=create_unit,  # NEVER NULL on create
+            added = 0
+            updated = 0
+            try:
+                with transaction.atomic():
+                    # One locked lookup for every submitted name (case-insensitive),
+                    # loading only the columns bulk_update writes back.
+                    existing = {
+                        obj.name_lower: obj
+                        for obj in Ingredient.objects.select_for_update()
+                        .annotate(name_lower=Lower("name"))
+                        .filter(user=request.user, name_lower__in=list(rows))
+                        .only("id", "name", "quantity", "unit")
+                    }
+
+                    updates: list[Ingredient] = []
+                    creates: list[Ingredient] = []
+                    for key, entry in rows.items():
+                        obj = existing.get(key)
+                        if obj is None:
+                            creates.append(
+                                Ingredient(
+                                    user=request.user,
+                                    name=entry["name"],
+                                    quantity=(
+                                        ""
+                                        if entry["quantity"] is None
+                                        else entry["quantity"]
+                                    ),
+                                    # For CREATE: ensure non-null unit using default 'pcs'
+                                    unit=entry["unit"] or "pcs",
+                                )
                             )
-                            added += 1
-                except IntegrityError:
-                    # One bad row shouldn't kill the whole request
-                    messages.error(
-                        request,
-                        f"Could not save “{name}”. Please adjust and try again.",
-                    )
-                    continue
+                            continue
+
+                        # Merge quantity
+                        if entry["quantity"] is not None:
+                            obj.quantity = (
+                                _to_decimal(obj.quantity) or Decimal("0")
+                            ) + entry["quantity"]
+                        # Update unit only if user provided one
+                        if entry["unit"]:
+                            obj.unit = entry["unit"]
+                        # Keep normalized name casing if you want
+                        obj.name = entry["name"]
+                        updates.append(obj)
+
+                    if updates:
+                        Ingredient.objects.bulk_update(
+                            updates, ["quantity", "unit", "name"]
+                        )
+                    if creates:
+                        Ingredient.objects.bulk_create(creates)
+                    added, updated = len(creates), len(updates)
+                _forget_pantry_names(request.user)
+            except IntegrityError:
+                logger.exception("Bulk pantry update failed.")
+                messages.error(
+                    request,
+                    "Could not save your pantry items. Please adjust and try again.",
+                )
+                return redirect("core:pantry_extract_review", upload_id=up.pk)
 
             if added or updated:
                 parts = []
@@ -1288,6 +1885,22 @@ def pantry_extract_review(request, upload_id: int):
     )
 
 
+@login_required
+def pantry_extract_status(request, upload_id: int):
+    """
+    JSON poll target for the review page while extraction runs in the
+    background: one indexed column read instead of re-rendering the page.
+    """
+    status = (
+        PantryImageUpload.objects.filter(pk=upload_id, user=request.user)
+        .values_list("status", flat=True)
+        .first()
+    )
+    if status is None:
+        raise Http404("Upload not found.")
+    return JsonResponse({"status": status, "pending": status == _STATUS_PENDING})
+
+
 @login_required
 def pantry_review(request, pk: int):
     """Legacy redirect to the new review URL."""
@@ -1323,58 +1936,125 @@ def pantry_upload_list(request):
 # =============================================================================
 
 
+# Minimum title similarity for a batched search result to count as a match.
+THUMB_MATCH_MIN_RATIO = 0.55
+# Concurrent per-title lookups; kept under the shared session's per-host pool
+# (services.http.POOL_MAXSIZE) so every worker reuses a warm keep-alive
+# connection instead of opening and discarding extra ones.
+THUMB_LOOKUP_WORKERS = min(8, POOL_MAXSIZE)
+
+
+def _batch_spoonacular_images(titles: List[str]) -> dict[str, str]:
+    """
+    Find (and rehost, preferring the storage copy) an image for each title,
+    running the lookups concurrently. Returns {title: url} for the hits.
+    """
+
+    def _one(title: str) -> Optional[str]:
+        try:
+            lookup_url = spoonacular_image_for(title)  # may be None
+        except Exception:
+            return None
+        if not lookup_url:
+            return None
+        try:
+            cached_url = cache_remote_image_to_storage(lookup_url, default_storage)
+        except Exception:
+            cached_url = None
+        return cached_url or lookup_url
+
+    unique = list(dict.fromkeys(t for t in titles if t))
+    if not unique:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(THUMB_LOOKUP_WORKERS, len(unique))) as ex:
+        return {t: u for t, u in zip(unique, ex.map(_one, unique)) if u}
+
+
+# Upper bounds on how long a search waits for each source (their own HTTP
+# timeouts normally fire first); a source that overruns just contributes nothing.
+SEARCH_WEB_TIMEOUT = 15
+SEARCH_AI_TIMEOUT = 50
+
+
+def _future_result(fut, timeout: float, label: str) -> list:
+    """
+    Return a search future's list, or [] if it failed or took too long. A
+    timed-out future is cancelled, so one still queued never runs (and spends
+    quota) after its caller has given up.
+    """
+    try:
+        return fut.result(timeout=timeout) or []
+    except FuturesTimeout:
+        fut.cancel()
+        logger.warning("%s search timed out after %ss.", label, timeout)
+    except Exception:
+        logger.exception("%s search failed.", label)
+    return []
+
+
 @login_required
 @require_http_methods(["POST"])
 def recipes_search(request):
     """
     Single entry point from the dashboard form.
     - Reads selected pantry items (or uses them all)
-    - Calls Spoonacular + OpenAI
+    - Calls Spoonacular, plus OpenAI unless Spoonacular already returned
+      settings.AI_ONLY_IF_FEWER_THAN results
     - Stores normalized results in session
     - Redirects to results page
     """
     names = _gather_ingredient_names(request)
     recipe_type = (request.POST.get("type") or "food").strip().lower()
 
-    web_items = _spoonacular_search(names, recipe_type=recipe_type, limit=12)
-    ai_items = _openai_generate(names, kind=recipe_type)
-
-    if ai_items:
-        for r in ai_items:
-            # handle dicts or simple objects
+    ai_threshold = getattr(settings, "AI_ONLY_IF_FEWER_THAN", 8)
+    if ai_threshold:
+        # Spoonacular is the fast, cheap source: only pay for the (slow) OpenAI
+        # round trip when it comes back short.
+        web_items = _spoonacular_search(names, recipe_type=recipe_type, limit=12)
+        ai_items = (
+            _openai_generate(names, kind=recipe_type)
+            if len(web_items) < ai_threshold
+            else []
+        )
+    else:
+        # Both upstream calls are independent network I/O: run them side by side
+        # so the wait is max(web, ai) instead of the sum. A per-request pool
+        # starts both at once, so the timeouts measure the calls themselves
+        # rather than time spent queued behind other requests' work.
+        pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search")
+        try:
+            fut_web = pool.submit(
+                _spoonacular_search, names, recipe_type=recipe_type, limit=12
+            )
+            fut_ai = pool.submit(_openai_generate, names, kind=recipe_type)
+            web_items = _future_result(fut_web, SEARCH_WEB_TIMEOUT, "Spoonacular")
+            ai_items = _future_result(fut_ai, SEARCH_AI_TIMEOUT, "OpenAI")
+        finally:
+            # Don't wait for a call that timed out; its thread exits on its own.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    # Resolve all missing AI images in one concurrent batch at write time, so
+    # the results grid and recipe_detail rarely have to look any up later.
+    missing = []
+    for r in ai_items or []:
+        # handle dicts or simple objects
+        if isinstance(r, dict):
+            title = r.get("title")
+            has_img = bool(r.get("image_url") or r.get("image"))
+        else:
+            title = getattr(r, "title", None)
+            has_img = bool(getattr(r, "image_url", None) or getattr(r, "image", None))
+        if title and not has_img:
+            missing.append((r, title))
+
+    found = _batch_spoonacular_images([t for _, t in missing])
+    for r, title in missing:
+        final_url = found.get(title)
+        if final_url:
             if isinstance(r, dict):
-                title = r.get("title")
-                has_img = bool(r.get("image_url") or r.get("image"))
+                r["image_url"] = final_url
             else:
-                title = getattr(r, "title", None)
-                has_img = bool(
-                    getattr(r, "image_url", None) or getattr(r, "image", None)
-                )
-
-            if title and not has_img:
-                # 1) try to find a representative image
-                try:
-                    lookup_url = spoonacular_image_for(title)  # may be None
-                except Exception:
-                    lookup_url = None
-
-                # 2) cache to S3 if we found one
-                cached_url = None
-                if lookup_url:
-                    try:
-                        cached_url = cache_remote_image_to_storage(
-                            lookup_url, default_storage
-                        )
-                    except Exception:
-                        cached_url = None
-
-                # 3) set final URL (prefer S3)
-                final_url = cached_url or lookup_url
-                if final_url:
-                    if isinstance(r, dict):
-                        r["image_url"] = final_url
-                    else:
-                        setattr(r, "image_url", final_url)
+                setattr(r, "image_url", final_url)
 
     if not web_items and not ai_items:
         messages.warning(
@@ -1386,6 +2066,92 @@ def recipes_search(request):
     return redirect("core:recipes_results")
 
 
+@_cached_title_image("spoon:thumb")
+def _spoonacular_thumb(title: str) -> str | None:
+    """Return a small image URL for a dish title via Spoonacular."""
+    api_key = getattr(settings, "SPOONACULAR_API_KEY", None) or os.getenv(
+        "SPOONACULAR_API_KEY"
+    )
+    if not api_key or not title:
+        return None
+    try:
+        r = _SESSION.get(
+            "https://api.spoonacular.com/recipes/complexSearch",
+            params={"apiKey": api_key, "query": title, "number": 1},
+            timeout=6,
+        )
+        if r.ok:
+            results = (_response_json(r) or {}).get("results") or []
+            if results and results[0].get("image"):
+                return results[0]["image"]
+    except Exception:
+        pass
+    return None
+
+
+def _spoonacular_thumbs_bulk(titles: List[str]) -> dict[str, str]:
+    """
+    Look up thumbnails for several dish titles with ONE complexSearch call,
+    then fuzzy-match the returned recipes back to each title.
+    Returns {title: image_url} for confident matches only (may be partial).
+    """
+    api_key = getattr(settings, "SPOONACULAR_API_KEY", None) or os.getenv(
+        "SPOONACULAR_API_KEY"
+    )
+    if not api_key or not titles:
+        return {}
+    try:
+        r = _SESSION.get(
+            "https://api.spoonacular.com/recipes/complexSearch",
+            params={
+                "apiKey": api_key,
+                "query": " ".join(titles[:3]),
+                "number": min(100, len(titles) * 2),
+            },
+            timeout=6,
+        )
+        if not r.ok:
+            return {}
+        results = (_response_json(r) or {}).get("results") or []
+    except Exception:
+        return {}
+
+    candidates = [
+        ((res.get("title") or "").lower(), res["image"])
+        for res in results
+        if res.get("image") and res.get("title")
+    ]
+    out: dict[str, str] = {}
+    for title in titles:
+        t = title.lower()
+        best_url, best_ratio = None, THUMB_MATCH_MIN_RATIO
+        for cand_title, url in candidates:
+            ratio = SequenceMatcher(None, t, cand_title).ratio()
+            if ratio > best_ratio:
+                best_url, best_ratio = url, ratio
+        if best_url:
+            out[title] = best_url
+    return out
+
+
+def _result_as_dict(item) -> dict:
+    """Return a results entry as a dict (legacy entries may be objects)."""
+    if isinstance(item, dict):
+        return item
+    kind = getattr(item, "kind", "") or getattr(item, "type", "") or ""
+    return {
+        "id": getattr(item, "id", None),
+        "title": getattr(item, "title", None) or getattr(item, "name", ""),
+        "image_url": (
+            getattr(item, "image_url", None)
+            or getattr(item, "image", None)
+            or getattr(item, "thumb", None)
+        ),
+        "source": getattr(item, "source", None),
+        "is_ai": kind.lower() == "ai" or bool(getattr(item, "is_ai", False)),
+    }
+
+
 @login_required
 def recipes_results(request):
     """
@@ -1393,121 +2159,109 @@ def recipes_results(request):
 
     If an AI result has no image, we try to fetch a thumbnail from Spoonacular
     (using SPOONACULAR_API_KEY) and attach it as `image_url` so the results grid
-    looks consistent with web results. We save the enriched results back into
-    the session to avoid repeat API calls on every page load.
+    looks consistent with web results. Found thumbnails are cached as a small
+    title -> url map for this result set to avoid repeat API calls on every
+    page load.
     """
-    # Remember this page so detail views can link back reliably
-    request.session["last_results_url"] = request.get_full_path()
-
-    # Pull results from session
-    data = request.session.get("recipe_results") or {}
-    combined = list(data.get("combined") or [])
-    ai = list(data.get("ai") or [])
-    web = list(data.get("web") or [])
-
-    # ---------- helpers (local to keep this view drop-in) ----------
-
-    def _get(item, attr, default=None):
-        if isinstance(item, dict):
-            return item.get(attr, default)
-        return getattr(item, attr, default)
-
-    def _set(item, attr, value):
-        if isinstance(item, dict):
-            item[attr] = value
-        else:
-            setattr(item, attr, value)
-
-    def _is_ai(item) -> bool:
-        """Return True if this result was AI-generated."""
-        _get = lambda o, k, d=None: (
-            o.get(k, d) if isinstance(o, dict) else getattr(o, k, d)
-        )
-
-        kind = (_get(item, "kind", "") or _get(item, "type", "")).lower()
-        if kind == "ai":
-            return True
-        if bool(_get(item, "is_ai", False)):
-            return True
-        # Support for 'source' key (your AI results use this)
-        return (_get(item, "source", "") or "").lower() == "ai"
-
-    def _has_image(item) -> bool:
-        return bool(
-            _get(item, "image_url") or _get(item, "image") or _get(item, "thumb")
+    # Remember this page so detail views can link back reliably (only writing
+    # the session when the URL actually changes)
+    path = request.get_full_path()
+    if request.session.get("last_results_url") != path:
+        request.session["last_results_url"] = path
+
+    # Pull results from the session's results cache
+    data = _load_results(request, "recipe_results", {})
+
+    # Single pass: coerce to dicts and collect AI items that need an image
+    combined = [_result_as_dict(x) for x in data.get("combined") or ()]
+    ai = [_result_as_dict(x) for x in data.get("ai") or ()]
+    missing: dict[int, str] = {}  # id(item) -> title
+    # `combined` already holds the `ai` entries (usually the very same dicts);
+    # visit each object once so lookups aren't duplicated.
+    seen: set[int] = set()
+    for item in (*combined, *ai):
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        is_ai = (
+            (item.get("kind") or item.get("type") or "").lower() == "ai"
+            or bool(item.get("is_ai"))
+            or (item.get("source") or "").lower() == "ai"
         )
+        if not is_ai or item.get("image_url") or item.get("image") or item.get("thumb"):
+            continue
+        title = (item.get("title") or item.get("name") or "").strip()
+        if title:
+            missing[id(item)] = title
 
-    def _title_of(item) -> str:
-        return (_get(item, "title") or _get(item, "name") or "").strip()
-
-    def _spoonacular_thumb(title: str) -> str | None:
-        """Return a small image URL for a dish title via Spoonacular."""
-        api_key = getattr(settings, "SPOONACULAR_API_KEY", None) or os.getenv(
-            "SPOONACULAR_API_KEY"
-        )
-        if not api_key or not title:
-            return None
-        try:
-            r = requests.get(
-                "https://api.spoonacular.com/recipes/complexSearch",
-                params={"apiKey": api_key, "query": title, "number": 1},
-                timeout=6,
+    # Deduplicate while preserving order
+    titles_needed = list(dict.fromkeys(missing.values()))
+
+    # 0) Thumbnails already found for this result set are kept as a small
+    #    title -> url overlay next to the payload, which itself is never
+    #    rewritten just to add image URLs.
+    token = request.session.get("recipe_results_token")
+    thumbs_key = f"rr:thumbs:{token}" if token else None
+    known: dict[str, str] = (cache.get(thumbs_key) if thumbs_key else None) or {}
+    title_to_url = {t: known[t] for t in titles_needed if t in known}
+
+    # 1) Titles looked up recently come straight from the cache
+    keys = {
+        t: _title_image_cache_key("spoon:thumb", t)
+        for t in titles_needed
+        if t not in title_to_url
+    }
+    hits = cache.get_many(list(keys.values())) if keys else {}
+    for t, k in keys.items():
+        if hits.get(k):
+            title_to_url[t] = hits[k]
+    pending = [t for t in keys if keys[t] not in hits]
+
+    # 2) One batched search for the rest; prime the per-title cache with matches
+    if len(pending) > 1:
+        bulk = _spoonacular_thumbs_bulk(pending)
+        for t, u in bulk.items():
+            cache.set(keys[t], u, IMAGE_LOOKUP_CACHE_TTL)
+        title_to_url.update(bulk)
+        pending = [t for t in pending if t not in bulk]
+
+    # 3) Anything unmatched: per-title lookups, in parallel (network-bound)
+    if pending:
+        workers = min(THUMB_LOOKUP_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            title_to_url.update(
+                {
+                    t: u
+                    for t, u in zip(pending, ex.map(_spoonacular_thumb, pending))
+                    if u
+                }
             )
-            if r.ok:
-                results = (r.json() or {}).get("results") or []
-                if results and results[0].get("image"):
-                    return results[0]["image"]
-        except Exception:
-            pass
-        return None
 
-    # ----------------------------------------------------------------
+    # Remember new finds so the next page view skips the lookups entirely
+    if thumbs_key and any(known.get(t) != u for t, u in title_to_url.items()):
+        cache.set(thumbs_key, {**known, **title_to_url}, RESULTS_CACHE_TTL)
 
-    # Collect AI titles that need an image
-    titles_needed = []
-    for seq in (combined, ai):
-        for item in seq:
-            if _is_ai(item) and not _has_image(item):
-                t = _title_of(item)
-                if t:
-                    titles_needed.append(t)
-
-    # Deduplicate while preserving order
-    titles_needed = list(dict.fromkeys(titles_needed))
-
-    # Fetch thumbnails once per title
-    title_to_url: dict[str, str] = {}
-    for title in titles_needed:
-        url = _spoonacular_thumb(title)
+    # Thumbnails and "Saved" badges (one cached favorites lookup for the whole
+    # grid) go on shallow copies: the entries belong to the stored bundle,
+    # which may be the session's own copy.
+    saved = _saved_recipe_pks(request)
+    rows = []
+    for item in combined:
+        row = dict(item)
+        url = title_to_url.get(missing.get(id(item), ""))
         if url:
-            title_to_url[title] = url
-
-    # Apply thumbnails to items and mark if session needs saving
-    changed = False
-    if title_to_url:
-        for seq in (combined, ai):
-            for item in seq:
-                if _is_ai(item) and not _has_image(item):
-                    url = title_to_url.get(_title_of(item))
-                    if url:
-                        _set(item, "image_url", url)
-                        changed = True
-
-    # Persist enriched results back to session so we don't refetch next time
-    if changed:
-        data["combined"] = combined
-        data["ai"] = ai
-        data["web"] = web
-        request.session["recipe_results"] = data
-        request.session.modified = True
+            row["image_url"] = url
+        src = "ai" if (item.get("source") or "").lower() == "ai" else "web"
+        row["saved"] = (src, str(item.get("id") or "")) in saved
+        rows.append(row)
 
     return render(
         request,
         "core/recipe_results.html",
         {
-            "combined": combined,
+            "combined": rows,
             "ai_count": len(ai),
-            "web_count": len(web),
+            "web_count": len(data.get("web") or ()),
         },
     )
 
@@ -1518,15 +2272,23 @@ def recipes_results(request):
 
 SPOON_MIN_MATCHED_API = 1
 SPOON_MIN_CONFIRMED = 1
-DRINK_TYPES = {"drink", "beverage", "beverages", "cocktail", "smoothie"}
+# Fall back to the (slower) regex/synonym matcher for names the exact set
+# intersection leaves unmatched, e.g. "chicken" vs "chicken breast".
+SPOON_FUZZY_MATCH = True
+DRINK_TYPES = frozenset({"drink", "beverage", "beverages", "cocktail", "smoothie"})
+# findByIngredients results drift as Spoonacular's catalogue changes; recipe
+# details (informationBulk) practically never do.
+SPOON_FIND_CACHE_TTL = 60 * 60
+SPOON_INFO_CACHE_TTL = 24 * 60 * 60
 
 
+@_cached_title_image("spoon:fallback")
 def _fallback_image_from_spoonacular(title: str) -> Optional[str]:
     api_key = os.getenv("SPOONACULAR_API_KEY")
     if not api_key or not title:
         return None
     try:
-        r = requests.get(
+        r = _SESSION.get(
             "https://api.spoonacular.com/recipes/complexSearch",
             params={
                 "apiKey": api_key,
@@ -1541,7 +2303,7 @@ def _fallback_image_from_spoonacular(title: str) -> Optional[str]:
                 "Spoonacular fallback image %s: %s", r.status_code, r.text[:200]
             )
             return None
-        items = (r.json() or {}).get("results") or []
+        items = (_response_json(r) or {}).get("results") or []
         if not items:
             return None
         return items[0].get("image")
@@ -1550,6 +2312,79 @@ def _fallback_image_from_spoonacular(title: str) -> Optional[str]:
         return None
 
 
+# Generated recipes for an identical pantry are reused for this long.
+AI_RECIPES_CACHE_TTL = 60 * 60
+# OpenAI-hosted image URLs expire after about an hour; keep them a bit less.
+AI_IMAGE_CACHE_TTL = 50 * 60
+# How long a queued generation blocks re-queueing the same title.
+AI_IMAGE_PENDING_TTL = 5 * 60
+
+
+def _generate_ai_image_url(title: str, kind: str, api_key: str) -> Optional[str]:
+    """Call OpenAI Images for one dish photo. Returns the image URL or None."""
+    try:
+        prompt = (
+            f"High-quality, appetizing {kind} photo: {title}. "
+            "Natural lighting, minimal props, social-ready composition."
+        )
+        r = _SESSION.post(
+            "https://api.openai.com/v1/images/generations",
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "model": "gpt-image-1",
+                "prompt": prompt,
+                "size": "1024x1024",
+                "n": 1,
+            },
+            timeout=60,
+        )
+        if r.status_code == 403:
+            logger.warning("OpenAI image gen blocked (403). Skipping images this run.")
+            return None
+        if r.status_code != 200:
+            logger.error("OpenAI image gen %s: %s", r.status_code, r.text)
+            return None
+        payload = _response_json(r)
+        data = payload.get("data") or []
+        return data[0].get("url") if data else None
+    except requests.RequestException:
+        logger.exception("Network error calling OpenAI Images")
+        return None
+    except Exception:
+        logger.exception("Unexpected error parsing image response")
+        return None
+
+
+def _store_ai_image(title: str, kind: str, api_key: str, key: str) -> None:
+    """Background job: generate an AI image and cache its URL for later renders."""
+    url = _generate_ai_image_url(title, kind, api_key)
+    if url:
+        cache.set(key, url, AI_IMAGE_CACHE_TTL)
+
+
+def _ai_image_for(title: str, kind: str, api_key: str) -> Optional[str]:
+    """
+    Return an already generated AI image for `title`, if any. Otherwise queue
+    generation in the background (once per title) and return None so the
+    caller can fall back to a Spoonacular image for this render.
+    """
+    key = _title_image_cache_key(f"ai:img:{kind}", title)
+    if key is None:
+        return None
+    url = cache.get(key)
+    if url:
+        return url
+    # cache.add is atomic: only the first request for a title queues a job
+    if cache.add(f"{key}:pending", True, AI_IMAGE_PENDING_TTL):
+        run_in_background(_store_ai_image, title, kind, api_key, key)
+        # With background tasks disabled the job ran inline; use its result.
+        return cache.get(key)
+    return None
+
+
 @login_required
 def ai_recipes(request):
     """Generate recipe ideas using OpenAI and render results.
@@ -1571,6 +2406,8 @@ def ai_recipes(request):
 
     External calls:
         - OpenAI Responses API (JSON content expected)
+        - OpenAI Images (ENABLE_AI_IMAGES only; generated in the background,
+          polled for by the page via ai_recipe_image_status)
         - Spoonacular image lookup (fallback only)
 
     Errors:
@@ -1585,7 +2422,7 @@ def ai_recipes(request):
         return redirect("core:dashboard")
 
     kind = (request.POST.get("kind") or "food").strip().lower()
-    pantry = list(request.user.ingredients.values_list("name", flat=True))
+    pantry = list(_pantry_names(request.user))
     if not pantry:
         messages.warning(request, "Your pantry is empty. Add some ingredients first.")
         return redirect("core:dashboard")
@@ -1595,85 +2432,55 @@ def ai_recipes(request):
         messages.error(request, "OpenAI API key not configured.")
         return redirect("core:dashboard")
 
-    def _gen_image_url(title: str, kind_: str) -> Optional[str]:
-        try:
-            prompt = (
-                f"High-quality, appetizing {kind_} photo: {title}. "
-                "Natural lighting, minimal props, social-ready composition."
-            )
-            r = requests.post(
-                "https://api.openai.com/v1/images/generations",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": "gpt-image-1",
-                    "prompt": prompt,
-                    "size": "1024x1024",
-                    "n": 1,
-                },
-                timeout=60,
-            )
-            if r.status_code == 403:
-                logger.warning(
-                    "OpenAI image gen blocked (403). Skipping images this run."
-                )
-                return None
-            if r.status_code != 200:
-                logger.error("OpenAI image gen %s: %s", r.status_code, r.text)
-                return None
-            payload = r.json()
-            data = payload.get("data") or []
-            return data[0].get("url") if data else None
-        except requests.RequestException:
-            logger.exception("Network error calling OpenAI Images")
-            return None
-        except Exception:
-            logger.exception("Unexpected error parsing image response")
-            return None
-
     # Your existing strict-json prompt
     system_msg = (
         "You are a professional chef. Generate exactly 4 recipes based on the user's pantry. "
         "Prefer using provided ingredients; suggest smart substitutions if needed. "
         f"The recipes must be type: {kind}. "
         "Return STRICT JSON ONLY with this schema:\n"
-        "{"
-        '  "recipes": [ {'
-        '      "title": string, "ingredients": [string], "steps": [string],'
-        '      "tags": [string], "cook_time_minutes": integer'
-        "  } ]"
-        "}"
-    )
-    user_msg = f"Pantry items: {', '.join(pantry)}"
-
-    try:
-        resp = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": "gpt-4o-mini",
-                "response_format": {"type": "json_object"},
-                "temperature": 0.7,
-                "messages": [
-                    {"role": "system", "content": system_msg},
-                    {"role": "user", "content": user_msg},
-                ],
-            },
-            timeout=60,
-        )
-        if resp.status_code != 200:
-            logger.error("OpenAI non-200 response: %s %s", resp.status_code, resp.text)
-            messages.error(request, f"AI request failed ({resp.status_code}).")
-            return redirect("core:dashboard")
+        "{"
+        '  "recipes": [ {'
+        '      "title": string, "ingredients": [string], "steps": [string],'
+        '      "tags": [string], "cook_time_minutes": integer'
+        "  } ]"
+        "}"
+    )
+    user_msg = f"Pantry items: {', '.join(pantry)}"
+
+    # Same pantry (any order/casing) + kind -> reuse a recent generation
+    recipes_key = _pantry_cache_key("ai:recipes", pantry, kind)
+
+    try:
+        recipes = cache.get(recipes_key)
+        if recipes is None:
+            resp = _SESSION.post(
+                "https://api.openai.com/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": "gpt-4o-mini",
+                    "response_format": {"type": "json_object"},
+                    "temperature": 0.7,
+                    "messages": [
+                        {"role": "system", "content": system_msg},
+                        {"role": "user", "content": user_msg},
+                    ],
+                },
+                timeout=60,
+            )
+            if resp.status_code != 200:
+                logger.error(
+                    "OpenAI non-200 response: %s %s", resp.status_code, resp.text
+                )
+                messages.error(request, f"AI request failed ({resp.status_code}).")
+                return redirect("core:dashboard")
 
-        data = resp.json()
-        payload = json.loads(data["choices"][0]["message"]["content"])
-        recipes = (payload.get("recipes") or [])[:4]
+            data = _response_json(resp)
+            payload = _json_loads(data["choices"][0]["message"]["content"])
+            recipes = (payload.get("recipes") or [])[:4]
+            cache.set(recipes_key, recipes, AI_RECIPES_CACHE_TTL)
 
         # ---- Normalize + image hydration (the key fix) --------------------
         enable_ai_images = bool(getattr(settings, "ENABLE_AI_IMAGES", False))
@@ -1685,42 +2492,58 @@ def ai_recipes(request):
             r["steps"] = r.get("steps") or []
             r["tags"] = r.get("tags") or []
 
-            # 1) Try your AI image (if enabled)
-            img = _gen_image_url(r["title"], kind) if enable_ai_images else None
+        def _resolve_image(title: str) -> tuple[Optional[str], bool]:
+            # 1) Try your AI image (if enabled and already generated). A None
+            #    here means generation is queued: the page polls for it.
+            img = _ai_image_for(title, kind, api_key) if enable_ai_images else None
+            ai_pending = enable_ai_images and not img
 
             # 2) Fallback to your existing Spoonacular-based helper (if present)
             if not img:
                 try:
                     # you already call this elsewhere; keep it if it exists
-                    img = _fallback_image_from_spoonacular(r["title"])  # noqa: F405
+                    img = _fallback_image_from_spoonacular(title)  # noqa: F405
                 except Exception:
                     img = None
 
             # 3) Final fallback: quick title→image guess + optional local cache
             if not img and spoonacular_image_for:
                 try:
-                    guess = spoonacular_image_for(r["title"])
+                    guess = spoonacular_image_for(title)
                     if guess and cache_remote_image_to_storage:
                         cached = cache_remote_image_to_storage(
-                            guess, subdir="ai", filename_slug=slugify(r["title"])
+                            guess, subdir="ai", filename_slug=slugify(title)
                         )
                         img = cached or guess
                     else:
                         img = guess
                 except Exception:
-                    logger.exception("Fallback image guess failed for %r", r["title"])
-
-            # Set BOTH keys so templates/favorites can use either
-            r["image_url"] = img
-            r["image"] = img
+                    logger.exception("Fallback image guess failed for %r", title)
+            return img, ai_pending
+
+        # Each recipe's image chain is independent network I/O: run them together
+        image_pending_ids = []
+        if recipes:
+            with ThreadPoolExecutor(max_workers=min(4, len(recipes))) as ex:
+                images = list(ex.map(_resolve_image, [r["title"] for r in recipes]))
+            for r, (img, ai_pending) in zip(recipes, images):
+                # Set BOTH keys so templates/favorites can use either
+                r["image_url"] = img
+                r["image"] = img
+                if ai_pending:
+                    image_pending_ids.append(r["id"])
         # -------------------------------------------------------------------
 
-        request.session["ai_recipes"] = recipes
-        request.session.modified = True
+        _store_results(request, "ai_recipes", recipes)
         return render(
             request,
             "core/ai_results.html",
-            {"recipes": recipes, "pantry": pantry, "kind": kind},
+            {
+                "recipes": recipes,
+                "pantry": pantry,
+                "kind": kind,
+                "image_pending_ids": image_pending_ids,
+            },
         )
 
     except requests.RequestException as e:
@@ -1733,6 +2556,37 @@ def ai_recipes(request):
         return redirect("core:dashboard")
 
 
+@login_required
+def ai_recipe_image_status(request, recipe_id: int):
+    """
+    JSON poll target for ai_results while a generated image is pending. Once
+    the image exists it is written into the stored results, so the detail
+    page and favorites use it too.
+    """
+    kind = (request.GET.get("kind") or "food").strip().lower()
+    recipes = _load_results(request, "ai_recipes", []) or []
+    item = next(
+        (
+            r
+            for r in recipes
+            if isinstance(r, dict) and str(r.get("id")) == str(recipe_id)
+        ),
+        None,
+    )
+    key = _title_image_cache_key(f"ai:img:{kind}", item.get("title")) if item else None
+    if key is None:
+        return JsonResponse({"pending": False, "image_url": None})
+    url = cache.get(key)
+    if url:
+        if item.get("image_url") != url:
+            item["image_url"] = url
+            item["image"] = url
+            _store_results(request, "ai_recipes", recipes)
+        return JsonResponse({"pending": False, "image_url": url})
+    pending = bool(cache.get(f"{key}:pending"))
+    return JsonResponse({"pending": pending, "image_url": None})
+
+
 @login_required
 @require_POST
 def web_recipes(request):
@@ -1764,7 +2618,7 @@ def web_recipes(request):
     )
     request.session["last_kind"] = kind
 
-    pantry_raw = list(request.user.ingredients.values_list("name", flat=True))
+    pantry_raw = _pantry_names(request.user)
     pantry = [_normalize_ingredient(x) for x in pantry_raw if x and x.strip()]
     if not pantry:
         messages.warning(request, "Your pantry is empty.")
@@ -1772,10 +2626,8 @@ def web_recipes(request):
 
     # If drinks are requested, do not hit Spoonacular at all.
     if kind == "drink":
-        request.session["web_recipes"] = (
-            []
-        )  # ensure combined/legacy views don't show stale web results
-        request.session.modified = True
+        # ensure combined/legacy views don't show stale web results
+        _store_results(request, "web_recipes", [])
         messages.info(
             request,
             "Showing AI drink recipes only; web results for drinks can be unreliable.",
@@ -1792,145 +2644,177 @@ def web_recipes(request):
         return redirect("core:dashboard")
 
     try:
-        find_resp = requests.get(
-            "https://api.spoonacular.com/recipes/findByIngredients",
-            params={
-                "apiKey": api_key,
-                "ingredients": ",".join(pantry),
-                "number": 15,
-                "ranking": 2,
-                "ignorePantry": True,
-                "fillIngredients": True,
-            },
-            timeout=20,
-        )
-
-        # ── Graceful degradation on 402/429: keep page working and show AI-only ──
-        if find_resp.status_code in (402, 429):
-            try:
-                detail = (find_resp.json() or {}).get("message") or ""
-            except Exception:
-                detail = ""
-            msg = "Spoonacular limit reached. Showing AI results only for now."
-            if detail:
-                msg += f" ({detail})"
-            messages.warning(request, msg)
-            request.session["web_recipes"] = []
-            request.session.modified = True
-            return render(
-                request,
-                "core/web_results.html",
-                {"results": [], "pantry": pantry, "kind": kind},
+        # Raw API payloads are cached so refreshes and repeat pantries skip the
+        # round trip; filtering below still runs on every request.
+        find_key = _pantry_cache_key("spoon:find", pantry, kind)
+        found_raw = cache.get(find_key)
+        if found_raw is None:
+            find_resp = _SESSION.get(
+                "https://api.spoonacular.com/recipes/findByIngredients",
+                params={
+                    "apiKey": api_key,
+                    "ingredients": ",".join(pantry),
+                    "number": 15,
+                    "ranking": 2,
+                    "ignorePantry": True,
+                    "fillIngredients": True,
+                },
+                timeout=20,
             )
-        # ────────────────────────────────────────────────────────────────────────
 
-        if find_resp.status_code != 200:
-            logger.error(
-                "findByIngredients %s: %s", find_resp.status_code, find_resp.text
-            )
-            messages.error(request, f"Recipe search failed ({find_resp.status_code}).")
-            request.session["web_recipes"] = []
-            request.session.modified = True
-            return render(
-                request,
-                "core/web_results.html",
-                {"results": [], "pantry": pantry, "kind": kind},
-            )
+            # ── Graceful degradation on 402/429: keep page working, show AI-only ──
+            if find_resp.status_code in (402, 429):
+                try:
+                    detail = (find_resp.json() or {}).get("message") or ""
+                except Exception:
+                    detail = ""
+                msg = "Spoonacular limit reached. Showing AI results only for now."
+                if detail:
+                    msg += f" ({detail})"
+                messages.warning(request, msg)
+                _store_results(request, "web_recipes", [])
+                return render(
+                    request,
+                    "core/web_results.html",
+                    {"results": [], "pantry": pantry, "kind": kind},
+                )
+            # ────────────────────────────────────────────────────────────────────
+
+            if find_resp.status_code != 200:
+                logger.error(
+                    "findByIngredients %s: %s", find_resp.status_code, find_resp.text
+                )
+                messages.error(
+                    request, f"Recipe search failed ({find_resp.status_code})."
+                )
+                _store_results(request, "web_recipes", [])
+                return render(
+                    request,
+                    "core/web_results.html",
+                    {"results": [], "pantry": pantry, "kind": kind},
+                )
+            found_raw = _response_json(find_resp) or []
+            cache.set(find_key, found_raw, SPOON_FIND_CACHE_TTL)
 
         found = [
             r
-            for r in (find_resp.json() or [])
+            for r in found_raw
             if (r.get("usedIngredientCount") or 0) >= SPOON_MIN_MATCHED_API
         ]
         if not found:
             messages.info(request, "No good matches—try adding one more ingredient.")
-            request.session["web_recipes"] = []
-            request.session.modified = True
+            _store_results(request, "web_recipes", [])
             return render(
                 request,
                 "core/web_results.html",
                 {"results": [], "pantry": pantry, "kind": kind},
             )
 
-        ids = [str(item["id"]) for item in found if "id" in item][:12]
+        # informationBulk is billed per id: only ask about the strongest matches
+        top = heapq.nlargest(
+            12,
+            (r for r in found if "id" in r),
+            key=lambda r: (
+                r.get("usedIngredientCount") or 0,
+                -(r.get("missedIngredientCount") or 0),
+            ),
+        )
+        ids = [str(r["id"]) for r in top]
         if not ids:
             messages.info(request, "No good matches—try adding one more ingredient.")
-            request.session["web_recipes"] = []
-            request.session.modified = True
+            _store_results(request, "web_recipes", [])
             return render(
                 request,
                 "core/web_results.html",
                 {"results": [], "pantry": pantry, "kind": kind},
             )
 
-        info_resp = requests.get(
-            "https://api.spoonacular.com/recipes/informationBulk",
-            params={
-                "apiKey": api_key,
-                "ids": ",".join(ids),
-                "includeNutrition": "true",
-            },
-            timeout=20,
-        )
-        if info_resp.status_code == 429:
-            messages.warning(
-                request,
-                "Spoonacular rate limit reached. Showing AI results only for now.",
-            )
-            request.session["web_recipes"] = []
-            request.session.modified = True
-            return render(
-                request,
-                "core/web_results.html",
-                {"results": [], "pantry": pantry, "kind": kind},
-            )
-        if info_resp.status_code != 200:
-            logger.error(
-                "informationBulk %s: %s", info_resp.status_code, info_resp.text
-            )
-            messages.error(request, f"Recipe details failed ({info_resp.status_code}).")
-            request.session["web_recipes"] = []
-            request.session.modified = True
-            return render(
-                request,
-                "core/web_results.html",
-                {"results": [], "pantry": pantry, "kind": kind},
+        ids_key = hashlib.sha1(",".join(sorted(ids)).encode()).hexdigest()
+        info_key = f"spoon:info:{ids_key}"
+        details_raw = cache.get(info_key)
+        if details_raw is None:
+            info_resp = _SESSION.get(
+                "https://api.spoonacular.com/recipes/informationBulk",
+                params={
+                    "apiKey": api_key,
+                    "ids": ",".join(ids),
+                    "includeNutrition": "true",
+                },
+                timeout=20,
             )
+            if info_resp.status_code == 429:
+                messages.warning(
+                    request,
+                    "Spoonacular rate limit reached. Showing AI results only for now.",
+                )
+                _store_results(request, "web_recipes", [])
+                return render(
+                    request,
+                    "core/web_results.html",
+                    {"results": [], "pantry": pantry, "kind": kind},
+                )
+            if info_resp.status_code != 200:
+                logger.error(
+                    "informationBulk %s: %s", info_resp.status_code, info_resp.text
+                )
+                messages.error(
+                    request, f"Recipe details failed ({info_resp.status_code})."
+                )
+                _store_results(request, "web_recipes", [])
+                return render(
+                    request,
+                    "core/web_results.html",
+                    {"results": [], "pantry": pantry, "kind": kind},
+                )
+            details_raw = _response_json(info_resp) or []
+            cache.set(info_key, details_raw, SPOON_INFO_CACHE_TTL)
 
-        details = {str(d["id"]): d for d in info_resp.json() if "id" in d}
+        details = {str(d["id"]): d for d in details_raw if "id" in d}
 
+        pantry_norm = frozenset(pantry)
         results: List[dict] = []
-        for item in found:
+        for item in top:
             sid = str(item.get("id"))
             det = details.get(sid, {})
             # Filter out drinks just in case Spoonacular mislabeled things
-            dish_types = set(
-                (det.get("dishTypes") or []) + (det.get("occasions") or [])
-            )
-            is_drink = bool(dish_types & DRINK_TYPES)
-            if is_drink:
+            if (
+                not DRINK_TYPES.isdisjoint(det.get("dishTypes") or ())
+                or not DRINK_TYPES.isdisjoint(det.get("occasions") or ())
+            ):
                 continue
 
             url = det.get("sourceUrl") or det.get("spoonacularSourceUrl")
             if not url and det.get("title") and sid:
                 url = f"https://spoonacular.com/recipes/{slugify(det['title'])}-{sid}"
 
-            def norm(s: Optional[str]) -> str:
-                return (s or "").strip().lower()
-
-            used_api = [
-                norm(u.get("name")) for u in (item.get("usedIngredients") or [])
-            ]
-            missed_api = [
-                norm(m.get("name")) for m in (item.get("missedIngredients") or [])
-            ]
-
-            used_confirmed = sorted(
-                {p for p in pantry if any(is_match(p, cand) for cand in used_api)}
-            )
-            missed_clean = sorted(
-                {m for m in missed_api if not any(is_match(p, m) for p in pantry)}
-            )
+            used_norm = {
+                _normalize_ingredient(u.get("name") or "")
+                for u in (item.get("usedIngredients") or [])
+            }
+            missed_norm = {
+                _normalize_ingredient(m.get("name") or "")
+                for m in (item.get("missedIngredients") or [])
+            }
+            used_norm.discard("")
+            missed_norm.discard("")
+
+            # Exact matches come from one set intersection; only the leftovers
+            # go through the per-pair fuzzy matcher.
+            confirmed = pantry_norm & used_norm
+            missed = missed_norm - pantry_norm
+            if SPOON_FUZZY_MATCH:
+                rest_used = used_norm - confirmed
+                if rest_used:
+                    confirmed |= {
+                        p
+                        for p in pantry_norm - confirmed
+                        if any(is_match(p, cand) for cand in rest_used)
+                    }
+                missed = {
+                    m for m in missed if not any(is_match(p, m) for p in pantry_norm)
+                }
+            used_confirmed = sorted(confirmed)
+            missed_clean = sorted(missed)
 
             if len(used_confirmed) < SPOON_MIN_CONFIRMED:
                 continue
@@ -1976,8 +2860,7 @@ def web_recipes(request):
                 }
             )
 
-        request.session["web_recipes"] = results
-        request.session.modified = True
+        _store_results(request, "web_recipes", results)
         return render(
             request,
             "core/web_results.html",
@@ -1987,8 +2870,7 @@ def web_recipes(request):
     except requests.RequestException as e:
         logger.exception("Spoonacular network error")
         messages.error(request, f"Network error calling Spoonacular: {e}")
-        request.session["web_recipes"] = []
-        request.session.modified = True
+        _store_results(request, "web_recipes", [])
         return render(
             request,
             "core/web_results.html",
@@ -1997,8 +2879,7 @@ def web_recipes(request):
     except Exception as e:
         logger.exception("Spoonacular parsing error")
         messages.error(request, f"Unexpected error: {e}")
-        request.session["web_recipes"] = []
-        request.session.modified = True
+        _store_results(request, "web_recipes", [])
         return render(
             request,
             "core/web_results.html",
@@ -2011,13 +2892,214 @@ def web_recipes(request):
 # =============================================================================
 
 
+# Generic steps for AI recipes that came back without instructions, picked by
+# the first keyword (in this order) that appears as a word in the title. Whole
+# words keep "meatballs" out of "bites", so list plurals and compounds
+# ("milkshake") explicitly.
+_AI_STEP_KEYWORDS = (
+    ("smoothie", "smoothie"),
+    ("smoothies", "smoothie"),
+    ("shake", "smoothie"),
+    ("shakes", "smoothie"),
+    ("milkshake", "smoothie"),
+    ("milkshakes", "smoothie"),
+    ("oatmeal", "oatmeal"),
+    ("oats", "oatmeal"),
+    ("toast", "toast"),
+    ("toasts", "toast"),
+    ("sandwich", "toast"),
+    ("sandwiches", "toast"),
+    ("salad", "salad"),
+    ("salads", "salad"),
+    ("bowl", "salad"),
+    ("bowls", "salad"),
+    ("ball", "bites"),
+    ("balls", "bites"),
+    ("bites", "bites"),
+)
+_TITLE_WORD_RE = re.compile(r"[a-z]+")
+_AI_STEP_TEMPLATES = {
+    "smoothie": (
+        "Add all ingredients to a blender.",
+        "Blend until completely smooth.",
+        "Taste and adjust sweetness or thickness as desired.",
+        "Pour into a glass and serve immediately.",
+    ),
+    "oatmeal": (
+        "Cook oats according to package directions (water or milk).",
+        "Stir in the remaining ingredients.",
+        "Simmer 1–2 minutes to warm through (optional).",
+        "Serve warm and top as desired.",
+    ),
+    "toast": (
+        "Toast the bread to your liking.",
+        "Spread almond butter evenly on the toast.",
+        "Top with sliced banana; drizzle honey if using.",
+        "Serve immediately.",
+    ),
+    "salad": (
+        "Chop or prep all ingredients as needed.",
+        "Combine in a bowl.",
+        "Dress, season with salt and pepper, and toss to coat.",
+        "Serve.",
+    ),
+    "bites": (
+        "In a bowl, stir all ingredients until evenly combined.",
+        "Chill the mixture for 15–20 minutes to firm up.",
+        "Roll into bite-size balls.",
+        "Refrigerate in an airtight container.",
+    ),
+    "default": (
+        "Prep ingredients (wash, peel, chop as needed).",
+        "Combine and season to taste.",
+        "Cook or chill if appropriate.",
+        "Serve.",
+    ),
+}
+
+
+def _heuristic_ai_steps(title: str) -> list[str]:
+    """Fallback instructions for an AI recipe, shared by detail and favorites."""
+    words = set(_TITLE_WORD_RE.findall((title or "").lower()))
+    category = next((cat for kw, cat in _AI_STEP_KEYWORDS if kw in words), "default")
+    return list(_AI_STEP_TEMPLATES[category])
+
+
+def _normalize_ingredients(raw) -> list[str]:
+    """
+    Ingredient lines from Spoonacular dicts or plain strings. The element type
+    is decided once from the first item rather than checked per element.
+    """
+    if not raw:
+        return []
+    if not isinstance(raw, list):
+        text = str(raw).strip()
+        return [text] if text else []
+    if isinstance(raw[0], dict):
+        lines = (
+            i.get("original") or i.get("originalString") or i.get("name") or ""
+            for i in raw
+        )
+    else:
+        lines = (str(x) for x in raw if x is not None)
+    return [t for t in map(str.strip, lines) if t]
+
+
+_LINE_SPLIT_RE = re.compile(r"[\r\n]+")
+# Sentence ends followed by a capital or digit, so "e.g. salt" stays in one step.
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9])")
+
+
+def _normalize_steps(
+    recipe: dict, meta: dict, source: str, title: str, link_hint: bool = True
+) -> list[str]:
+    """
+    Instruction list for a session recipe, shared by recipe_detail and
+    save_favorite: analyzedInstructions, then the plain-text/list fields, then
+    (optionally) a pointer to the source link, then AI heuristics.
+    """
+    # Primary path: analyzedInstructions → steps (all blocks)
+    analyzed = (
+        recipe.get("analyzedInstructions") or meta.get("analyzedInstructions") or []
+    )
+    if isinstance(analyzed, list):
+        steps = [
+            st["step"].strip()
+            for block in analyzed
+            if isinstance(block, dict)
+            for st in block.get("steps") or []
+            if isinstance(st, dict) and (st.get("step") or "").strip()
+        ]
+        if steps:
+            return steps
+
+    # Fallbacks: steps/method/directions/procedure/plain-text instructions
+    alt = (
+        recipe.get("steps")
+        or recipe.get("method")
+        or recipe.get("directions")
+        or recipe.get("procedure")
+        or meta.get("instructions")
+        or recipe.get("instructions")
+    )
+    steps = []
+    if isinstance(alt, list):
+        steps = [
+            str(s).strip()
+            for s in alt
+            if isinstance(s, (str, int, float)) and str(s).strip()
+        ]
+    elif isinstance(alt, str):
+        steps = [p.strip() for p in _LINE_SPLIT_RE.split(alt) if p.strip()]
+        if len(steps) == 1:
+            # One paragraph: split it into sentences instead
+            steps = [p.strip() for p in _SENT_SPLIT_RE.split(steps[0]) if p.strip()]
+    if steps:
+        return steps
+
+    # Last resort if we have a source link: show a helpful step
+    if link_hint and (recipe.get("url") or meta.get("sourceUrl")):
+        return ["Open the source link for full step-by-step instructions."]
+
+    # Heuristic instructions for AI items
+    if source == "ai":
+        return _heuristic_ai_steps(title)
+    return []
+
+
+def _recipe_image_status_key(token: str, rid: str) -> str:
+    return f"rr:img:{token}:{rid}"
+
+
+def _lookup_recipe_image(title: str) -> str:
+    """Find an image for an AI result by title and rehost it ("" for none)."""
+    remote_url = spoonacular_image_for(title)
+    cached_url = cache_remote_image_to_storage(remote_url) if remote_url else None
+    return cached_url or remote_url or ""
+
+
+def _attach_recipe_image(token: str, rid: str, title: str) -> None:
+    """
+    Background job: look up an image for an AI result and keep the outcome
+    ("" for none) under the status key polled by recipe_image_status. The
+    results bundle itself is only written on the request thread.
+    """
+    url = _lookup_recipe_image(title)
+    cache.set(_recipe_image_status_key(token, rid), url, RESULTS_CACHE_TTL)
+
+
+def _merge_recipe_image(request, rid: str, url: str) -> None:
+    """Write an AI result's image into the stored results bundle."""
+    bundle = _load_results(request, "recipe_results", {})
+    touched = False
+    for list_name in ("combined", "ai"):
+        it = _bundle_item(bundle, list_name, rid)
+        if it is not None and it.get("image_url") != url:
+            it["image_url"] = url
+            it["image"] = url
+            touched = True
+    if touched:
+        _store_results(request, "recipe_results", bundle)
+
+
+@login_required
+def recipe_image_status(request, source: str, recipe_id: str):
+    """JSON poll target for recipe_detail while a fallback image is looked up."""
+    token = request.session.get("recipe_results_token")
+    url = cache.get(_recipe_image_status_key(token, str(recipe_id))) if token else ""
+    if url:
+        _merge_recipe_image(request, str(recipe_id), url)
+    return JsonResponse({"pending": url is None, "image_url": url or None})
+
+
 @login_required
 def recipe_detail(
     request, source: str, rid: Optional[str] = None, recipe_id: Optional[int] = None
 ):
     """
     Show detail for a result stored in session.
-    - If it's an AI recipe and it has no image, attach a best-effort image.
+    - If it's an AI recipe and it has no image, look one up (in the background
+      with a shared cache; the page polls recipe_image_status and swaps it in).
     - If it's a WEB (Spoonacular) recipe missing ingredients/steps, fetch them once and cache in session.
     - Compute `already_saved` so the template can render the correct favorites CTA.
     """
@@ -2028,32 +3110,32 @@ def recipe_detail(
     recipe = _get_session_recipe(source, key, request)
     if not recipe:
         raise Http404("Recipe not found in session (maybe results expired).")
+    title = (recipe.get("title") or recipe.get("name") or "").strip()
 
     # =====================================================================
-    # 1) AI: attach best-effort image if missing (keeps your existing logic)
+    # 1) AI: attach best-effort image if missing (in the background if shared)
     # =====================================================================
+    image_pending = False
     try:
         if source == "ai" and not (recipe.get("image_url") or recipe.get("image")):
-            title = (recipe.get("title") or recipe.get("name") or "").strip()
-            if title:
-                remote_url = spoonacular_image_for(title)
-                cached_url = (
-                    cache_remote_image_to_storage(remote_url) if remote_url else None
-                )
-                final_url = cached_url or remote_url
-                if final_url:
-                    recipe["image_url"] = final_url
-                    recipe["image"] = final_url
-                    # Persist back into session so refresh stays enriched
-                    bundle = request.session.get("recipe_results") or {}
-                    for list_name in ("combined", "ai"):
-                        lst = bundle.get(list_name) or []
-                        for it in lst:
-                            if str(it.get("id")) == key_str:
-                                it["image_url"] = final_url
-                                it["image"] = final_url
-                    request.session["recipe_results"] = bundle
-                    request.session.modified = True
+            token = request.session.get("recipe_results_token")
+            if title and _cache_is_shared() and token:
+                # Every worker sees the status key: look up in the background
+                status_key = _recipe_image_status_key(token, key_str)
+                found = cache.get(status_key)
+                if found is None:
+                    # "" means the lookup already ran and found nothing
+                    image_pending = True
+                    if cache.add(f"{status_key}:pending", 1, AI_IMAGE_PENDING_TTL):
+                        run_in_background(_attach_recipe_image, token, key_str, title)
+            elif title:
+                found = _lookup_recipe_image(title)
+            else:
+                found = ""
+            if found:
+                _merge_recipe_image(request, key_str, found)
+                recipe["image_url"] = found
+                recipe["image"] = found
     except Exception:
         logger.exception("Failed to attach fallback image for AI recipe.")
 
@@ -2078,18 +3160,23 @@ def recipe_detail(
                 except Exception as e:
                     logger.warning("Detail enrich failed for id=%s: %s", sid, e)
 
-                # Merge what we got
-                if info.get("extendedIngredients"):
-                    recipe["extendedIngredients"] = info["extendedIngredients"]
-                if info.get("analyzedInstructions"):
-                    recipe["analyzedInstructions"] = info["analyzedInstructions"]
+                # Merge what we got. `recipe` may be the very dict held in the
+                # (per-request memoized) bundle, so note changes here rather
+                # than by comparing against the bundle afterwards.
+                touched = False
+                for fld in ("extendedIngredients", "analyzedInstructions"):
+                    if info.get(fld) and recipe.get(fld) != info[fld]:
+                        recipe[fld] = info[fld]
+                        touched = True
                 if info.get("instructions") and not recipe.get("instructions"):
                     recipe["instructions"] = info["instructions"]
+                    touched = True
                 if info.get("image") and not (
                     recipe.get("image") or recipe.get("image_url")
                 ):
                     recipe["image"] = info["image"]
                     recipe["image_url"] = info["image"]
+                    touched = True
 
                 # ensure sourceUrl lives under meta
                 meta = recipe.get("meta")
@@ -2098,6 +3185,7 @@ def recipe_detail(
                 if info.get("sourceUrl") and not meta.get("sourceUrl"):
                     meta["sourceUrl"] = info["sourceUrl"]
                     recipe["meta"] = meta
+                    touched = True
 
                 nut = (info.get("nutrition") or {}).get("nutrients") or []
 
@@ -2114,29 +3202,30 @@ def recipe_detail(
                         "carbs_g": int(round(float(_nut("carbohydrates") or 0))),
                         "fat_g": int(round(float(_nut("fat") or 0))),
                     }
+                    touched = True
 
-                # write back to session so future visits work
-                bundle = request.session.get("recipe_results") or {}
+                # write back to the results cache so future visits work (only
+                # when the lookup actually added something)
+                bundle = _load_results(request, "recipe_results", {}) if info else {}
                 for list_name in ("combined", "web"):
-                    lst = bundle.get(list_name) or []
-                    for it in lst:
-                        if str(it.get("id")) == str(sid):
-                            if recipe.get("extendedIngredients"):
-                                it["extendedIngredients"] = recipe[
-                                    "extendedIngredients"
-                                ]
-                            if recipe.get("analyzedInstructions"):
-                                it["analyzedInstructions"] = recipe[
-                                    "analyzedInstructions"
-                                ]
-                            if recipe.get("instructions"):
-                                it["instructions"] = recipe["instructions"]
-                            if recipe.get("image") and not it.get("image"):
-                                it["image"] = recipe["image"]
-                                it["image_url"] = recipe["image"]
-
-                request.session["recipe_results"] = bundle
-                request.session.modified = True
+                    it = _bundle_item(bundle, list_name, str(sid))
+                    if it is None:
+                        continue
+                    for fld in (
+                        "extendedIngredients",
+                        "analyzedInstructions",
+                        "instructions",
+                    ):
+                        if recipe.get(fld) and it.get(fld) != recipe[fld]:
+                            it[fld] = recipe[fld]
+                            touched = True
+                    if recipe.get("image") and not it.get("image"):
+                        it["image"] = recipe["image"]
+                        it["image_url"] = recipe["image"]
+                        touched = True
+
+                if touched and bundle:
+                    _store_results(request, "recipe_results", bundle)
     except Exception:
         # Never break the page; just log if you want
         logger.exception("Unhandled error enriching web recipe in detail view")
@@ -2144,119 +3233,17 @@ def recipe_detail(
     # =====================================================================
     # 3) Normalize meta + build instruction list with robust fallbacks
     # =====================================================================
-    recipe = recipe or {}
     meta = recipe.get("meta")
     if not isinstance(meta, dict):
         meta = {}
 
-    # Primary path: analyzedInstructions → steps
-    ai = recipe.get("analyzedInstructions") or meta.get("analyzedInstructions") or []
-    steps_list: list[str] = []
-    if isinstance(ai, list) and ai:
-        block0 = ai[0] or {}
-        raw_steps = block0.get("steps") or []
-        steps_list = [
-            s.get("step") for s in raw_steps if isinstance(s, dict) and s.get("step")
-        ]
-
-    # Fallbacks: steps/method/directions/procedure/plain-text instructions
-    if not steps_list:
-        alt = (
-            recipe.get("steps")
-            or recipe.get("method")
-            or recipe.get("directions")
-            or recipe.get("procedure")
-            or meta.get("instructions")
-            or recipe.get("instructions")
-        )
-        if isinstance(alt, list):
-            steps_list = [s for s in alt if isinstance(s, str) and s.strip()]
-        elif isinstance(alt, str):
-            raw = [p.strip() for p in alt.replace("\r", "").split("\n") if p.strip()]
-            if not raw:
-                raw = [p.strip() for p in alt.split(". ") if p.strip()]
-            steps_list = raw
-
-    # Last resort if still empty but we have a source link: show a helpful step
-    if not steps_list and (recipe.get("url") or meta.get("sourceUrl")):
-        steps_list = ["Open the source link for full step-by-step instructions."]
-
-    # Heuristic instructions for AI items (kept as-is)
-    if not steps_list and source == "ai":
-        title_l = (recipe.get("title") or "").lower()
-
-        def make(o):  # tiny helper to avoid empty strings
-            return [s for s in o if s and s.strip()]
-
-        if "smoothie" in title_l or "shake" in title_l:
-            steps_list = make(
-                [
-                    "Add all ingredients to a blender.",
-                    "Blend until completely smooth.",
-                    "Taste and adjust sweetness or thickness as desired.",
-                    "Pour into a glass and serve immediately.",
-                ]
-            )
-        elif "oatmeal" in title_l or "overnight oats" in title_l:
-            steps_list = make(
-                [
-                    "Cook oats according to package directions (water or milk).",
-                    "Stir in the remaining ingredients.",
-                    "Simmer 1–2 minutes to warm through (optional).",
-                    "Serve warm and top as desired.",
-                ]
-            )
-        elif "toast" in title_l or "sandwich" in title_l:
-            steps_list = make(
-                [
-                    "Toast the bread to your liking.",
-                    "Spread almond butter evenly on the toast.",
-                    "Top with sliced banana; drizzle honey if using.",
-                    "Serve immediately.",
-                ]
-            )
-        elif "salad" in title_l or "bowl" in title_l:
-            steps_list = make(
-                [
-                    "Chop or prep all ingredients as needed.",
-                    "Combine in a bowl.",
-                    "Dress, season with salt and pepper, and toss to coat.",
-                    "Serve.",
-                ]
-            )
-        elif "energy ball" in title_l or "balls" in title_l or "bites" in title_l:
-            steps_list = make(
-                [
-                    "In a bowl, stir all ingredients until evenly combined.",
-                    "Chill the mixture for 15–20 minutes to firm up.",
-                    "Roll into bite-size balls.",
-                    "Refrigerate in an airtight container.",
-                ]
-            )
-        else:
-            steps_list = make(
-                [
-                    "Prep ingredients (wash, peel, chop as needed).",
-                    "Combine and season to taste.",
-                    "Cook or chill if appropriate.",
-                    "Serve.",
-                ]
-            )
+    steps_list = _normalize_steps(recipe, meta, source, title)
 
     # =====================================================================
     # 4) Favorites state for the CTA
     # =====================================================================
-    already_saved = False
-    favorite_pk = None
-    if request.user.is_authenticated and key_str:
-        qs = SavedRecipe.objects.filter(
-            user=request.user,
-            source=source,
-            external_id=key_str,
-        )
-        if qs.exists():
-            already_saved = True
-            favorite_pk = qs.values_list("pk", flat=True).first()
+    favorite_pk = _saved_recipe_pks(request).get((source, key_str)) if key_str else None
+    already_saved = favorite_pk is not None
 
     # =====================================================================
     # 5) Final template-friendly fields (image + ingredients list[str])
@@ -2269,22 +3256,9 @@ def recipe_detail(
         or recipe.get("thumbnail")
     )
 
-    ingredients_list: list[str] = []
-    ext = recipe.get("extendedIngredients") or meta.get("extendedIngredients") or []
-    if isinstance(ext, list) and ext:
-        for it in ext:
-            if isinstance(it, dict):
-                txt = (it.get("original") or it.get("name") or "").strip()
-                if txt:
-                    ingredients_list.append(txt)
-    if not ingredients_list:
-        alt_ing = recipe.get("ingredients") or meta.get("ingredients")
-        if isinstance(alt_ing, list):
-            ingredients_list = [
-                s.strip() for s in alt_ing if isinstance(s, str) and s.strip()
-            ]
-
-    from django.urls import reverse  # already imported near the top of file
+    ingredients_list = _normalize_ingredients(
+        recipe.get("extendedIngredients") or meta.get("extendedIngredients")
+    ) or _normalize_ingredients(recipe.get("ingredients") or meta.get("ingredients"))
 
     back_url = (
         request.session.get("last_results_url")
@@ -2306,6 +3280,7 @@ def recipe_detail(
             "steps_list": steps_list,
             "ingredients_list": ingredients_list,
             "image_url_final": image_url_final,
+            "image_pending": image_pending and not image_url_final,
             "already_saved": already_saved,
             "favorite_pk": favorite_pk,
             "current_id_str": key_str,
@@ -2339,11 +3314,15 @@ def favorite_detail(request, pk: int):
     elif isinstance(fav.steps_json, str):
         steps_list = [s.strip() for s in fav.steps_json.split("\n") if s.strip()]
 
+    # Stored URLs are public and unsigned (AWS_QUERYSTRING_AUTH = False), so
+    # the saved value is used as-is: no per-view signing or lookup.
+    image_url = fav.image_url or ""
+
     # --- Minimal recipe dict (template uses several keys on `recipe`) ---
     recipe = {
         "id": fav.external_id or str(fav.pk),
         "title": fav.title or "Recipe",
-        "image_url": fav.image_url or "",
+        "image_url": image_url,
         "ingredients": ingredients,
         "extendedIngredients": ingredients,
         "steps": steps_list,
@@ -2367,7 +3346,7 @@ def favorite_detail(request, pk: int):
             "source": fav.source,  # "ai" or "web"
             "steps_list": steps_list,
             "ingredients_list": ingredients,
-            "image_url_final": fav.image_url or "",
+            "image_url_final": image_url,
             "already_saved": True,  # it's a favorite
             "favorite_pk": fav.pk,
             "current_id_str": str(fav.external_id or fav.pk),  # used by Log Meal form
@@ -2409,119 +3388,19 @@ def save_favorite(request, source, recipe_id):
         or recipe.get("extended_ingredients")
         or []
     )
-    ingredients: list[str] = []
-    if isinstance(ingredients_raw, list):
-        if ingredients_raw and isinstance(ingredients_raw[0], dict):
-            for i in ingredients_raw:
-                text = i.get("original") or i.get("originalString") or i.get("name")
-                if text:
-                    ingredients.append(text.strip())
-        else:
-            ingredients = [str(x).strip() for x in ingredients_raw if str(x).strip()]
-    elif ingredients_raw:
-        ingredients = [str(ingredients_raw).strip()]
+    ingredients = _normalize_ingredients(ingredients_raw)
 
     # ---- normalize steps (same fallbacks as detail view) ----
-    meta_obj = recipe.get("meta") or {}
-    steps_raw = (
-        recipe.get("steps")
-        or recipe.get("instructions")
-        or recipe.get("analyzedInstructions")
-        or recipe.get("method")
-        or recipe.get("directions")
-        or recipe.get("procedure")
-        or meta_obj.get("instructions")
-        or []
-    )
-
-    steps: list[str] = []
-
-    def _norm_list(lst):
-        return [
-            str(s).strip()
-            for s in lst
-            if isinstance(s, (str, int, float)) and str(s).strip()
-        ]
-
-    if isinstance(steps_raw, str):
-        parts = [
-            p.strip() for p in steps_raw.replace("\r", "").split("\n") if p.strip()
-        ]
-        if not parts:
-            parts = [p.strip() for p in steps_raw.split(". ") if p.strip()]
-        steps = parts
-    elif isinstance(steps_raw, list):
-        if steps_raw and isinstance(steps_raw[0], dict) and "steps" in steps_raw[0]:
-            for block in steps_raw:
-                for st in block.get("steps") or []:
-                    txt = (st.get("step") or "").strip()
-                    if txt:
-                        steps.append(txt)
-        else:
-            steps = _norm_list(steps_raw)
-
-    if not steps and source == "ai":
-        title_l = title.lower()
-
-        def _make(seq):
-            return [s for s in seq if s and s.strip()]
-
-        if "smoothie" in title_l or "shake" in title_l:
-            steps = _make(
-                [
-                    "Add all ingredients to a blender.",
-                    "Blend until completely smooth.",
-                    "Taste and adjust sweetness or thickness as desired.",
-                    "Pour into a glass and serve immediately.",
-                ]
-            )
-        elif "oatmeal" in title_l or "overnight oats" in title_l:
-            steps = _make(
-                [
-                    "Cook oats according to package directions (water or milk).",
-                    "Stir in the remaining ingredients.",
-                    "Simmer 1–2 minutes to warm through (optional).",
-                    "Serve warm and top as desired.",
-                ]
-            )
-        elif "toast" in title_l or "sandwich" in title_l:
-            steps = _make(
-                [
-                    "Toast the bread to your liking.",
-                    "Spread almond butter evenly on the toast.",
-                    "Top with sliced banana; drizzle honey if using.",
-                    "Serve immediately.",
-                ]
-            )
-        elif "salad" in title_l or "bowl" in title_l:
-            steps = _make(
-                [
-                    "Chop or prep all ingredients as needed.",
-                    "Combine in a bowl.",
-                    "Dress, season with salt and pepper, and toss to coat.",
-                    "Serve.",
-                ]
-            )
-        elif "energy ball" in title_l or "balls" in title_l or "bites" in title_l:
-            steps = _make(
-                [
-                    "In a bowl, stir all ingredients until evenly combined.",
-                    "Chill the mixture for 15–20 minutes to firm up.",
-                    "Roll into bite-size balls.",
-                    "Refrigerate in an airtight container.",
-                ]
-            )
-        else:
-            steps = _make(
-                [
-                    "Prep ingredients (wash, peel, chop as needed).",
-                    "Combine and season to taste.",
-                    "Cook or chill if appropriate.",
-                    "Serve.",
-                ]
-            )
-
-    # Persist (idempotent)
+    meta_obj = recipe.get("meta")
+    if not isinstance(meta_obj, dict):
+        meta_obj = {}
+    steps = _normalize_steps(recipe, meta_obj, source, title, link_hint=False)
+
+    # Persist (idempotent). Deliberately not a single INSERT ... ON CONFLICT
+    # (bulk_create(update_conflicts=True)): that would overwrite stored fields
+    # instead of only back-filling empty ones, and can't tell us whether the
+    # row was created, updated or left alone for the message below. The
+    # lookup is one probe on the (user, source, external_id) unique index.
     try:
         obj, created = SavedRecipe.objects.get_or_create(
             user=request.user,
@@ -2557,14 +3436,20 @@ def save_favorite(request, source, recipe_id):
 
             # Also backfill macros if missing and we fetched some
             for fld in ("calories", "protein_g", "carbs_g", "fat_g"):
-                if getattr(obj, fld) in (None, Decimal("0")) and macros.get(
-                    fld
-                ) not in (None, ""):
-                    setattr(obj, fld, macros.get(fld))
-                    updated_fields.append(fld)
+                value = macros.get(fld)
+                if value in (None, "") or getattr(obj, fld) not in (None, Decimal("0")):
+                    continue
+                if value == getattr(obj, fld):
+                    continue  # 0 -> 0 is not a change
+                setattr(obj, fld, value)
+                updated_fields.append(fld)
 
+            # Each field is appended at most once; only those are written
             if updated_fields:
-                obj.save(update_fields=list(set(updated_fields)))
+                obj.save(update_fields=updated_fields)
+
+        if created or updated_fields:
+            cache.delete(_favs_cache_key(request.user.pk))
 
         messages.success(
             request,
@@ -2585,9 +3470,56 @@ def save_favorite(request, source, recipe_id):
     return redirect("core:favorites")
 
 
+FAVORITES_CACHE_TTL = 5 * 60
+
+
+def _favs_cache_key(user_id) -> str:
+    return f"favs:list:{user_id}"
+
+
+def _favorite_rows(user) -> list:
+    """The user's SavedRecipe rows (light columns only), cached per user.
+
+    The rows (not the HTML: it carries a per-session CSRF token) are cached
+    until a favorite is saved, edited or removed. Only with a shared cache:
+    a per-process one can't see invalidations made by other workers.
+    """
+    shared = _cache_is_shared()
+    key = _favs_cache_key(user.pk)
+    items = cache.get(key) if shared else None
+    if items is None:
+        # The cards only show title/image/source: leave the JSON columns in the DB
+        items = list(
+            user.saved_recipes.only(
+                "id", "title", "image_url", "source", "external_id", "created_at"
+            )
+        )
+        if shared:
+            cache.set(key, items, FAVORITES_CACHE_TTL)
+    return items
+
+
+def _saved_recipe_pks(request) -> dict[tuple[str, str], int]:
+    """Map (source, external_id) -> SavedRecipe pk for the current user.
+
+    Built once per request from the cached favorite rows, so "already saved"
+    checks on the results and detail pages cost no per-recipe queries.
+    """
+    saved = getattr(request, "_saved_recipe_pks", None)
+    if saved is None:
+        saved = {}
+        if request.user.is_authenticated:
+            saved = {
+                (fav.source, fav.external_id): fav.pk
+                for fav in _favorite_rows(request.user)
+            }
+        request._saved_recipe_pks = saved
+    return saved
+
+
 @login_required
 def favorites_list(request):
-    items = request.user.saved_recipes.all()
+    items = _favorite_rows(request.user)
     return render(request, "core/favorites.html", {"items": items})
 
 
@@ -2596,6 +3528,7 @@ def favorites_list(request):
 def favorite_delete(request, pk: int):
     fav = get_object_or_404(SavedRecipe, pk=pk, user=request.user)
     fav.delete()
+    cache.delete(_favs_cache_key(request.user.pk))
     messages.success(request, "Removed from Favorites.")
     return redirect("core:favorites")
 
@@ -2614,6 +3547,7 @@ def recipe_create(request):
             obj.user = request.user
             obj.source = obj.source or "ai"
             obj.save()
+            cache.delete(_favs_cache_key(obj.user_id))
             return redirect("core:favorite_detail", pk=obj.pk)
     else:
         form = SavedRecipeForm()
@@ -2629,6 +3563,7 @@ def recipe_update(request, pk):
         form = SavedRecipeForm(request.POST, request.FILES, instance=obj)
         if form.is_valid():
             form.save()
+            cache.delete(_favs_cache_key(obj.user_id))
             return redirect("core:favorite_detail", pk=obj.pk)
     else:
         form = SavedRecipeForm(instance=obj)
@@ -2642,6 +3577,7 @@ def recipe_delete(request, pk):
     if obj.user != request.user and not request.user.is_superuser:
         raise PermissionDenied("You do not have permission to delete this recipe.")
     obj.delete()
+    cache.delete(_favs_cache_key(obj.user_id))
     return redirect("core:dashboard")
 
 
@@ -2654,6 +3590,44 @@ def _monday_for(anchor: dt.date) -> dt.date:
     return anchor - dt.timedelta(days=anchor.weekday())
 
 
+# Gap suggestions are rendered on every Targets page load
+SPOON_GAPS_CACHE_TTL = 10 * 60
+# Fingerprint of the plan rows last copied into LoggedMeal (per user and day)
+PLAN_SYNC_TTL = 12 * 60 * 60
+
+
+def _plan_sync_key(user_id, day: dt.date) -> str:
+    return f"lm_sync:{user_id}:{day.isoformat()}"
+
+
+def _plan_day_fingerprint(user, day: dt.date) -> tuple:
+    """
+    (meal id, recipe id) pairs for the user's plan on `day`. Any add, delete or
+    recipe swap changes it, so a stale sync marker is noticed by every worker
+    without relying on cache deletes reaching them.
+    """
+    return tuple(
+        Meal.objects.filter(plan__user=user, date=day)
+        .order_by("id")
+        .values_list("id", "recipe_id")
+    )
+
+
+# Meal-plan slots never change at runtime: resolve them once at import
+if hasattr(Meal, "Slot") and hasattr(Meal.Slot, "choices"):
+    _MEAL_SLOT_CHOICES = tuple(Meal.Slot.choices)
+elif hasattr(Meal, "MEAL_TYPES"):
+    _MEAL_SLOT_CHOICES = tuple(Meal.MEAL_TYPES)
+else:
+    _MEAL_SLOT_CHOICES = (
+        ("breakfast", "Breakfast"),
+        ("lunch", "Lunch"),
+        ("dinner", "Dinner"),
+        ("snack", "Snack"),
+    )
+_MEAL_SLOT_VALUES = frozenset(v for v, _ in _MEAL_SLOT_CHOICES)
+
+
 def suggest_recipes_for_gaps(target, totals, search_fn, max_items: int = 4):
     """Heuristic helper to suggest recipes when the user's plan has nutrition gaps.
 
@@ -2690,12 +3664,18 @@ def suggest_recipes_for_gaps(target, totals, search_fn, max_items: int = 4):
     else:
         query = "healthy simple lunch"
 
-    # Pull more than we need so we can rank
-    try:
-        raw = search_fn(query=query, number=24, add_recipe_nutrition=True)
-    except TypeError:
-        # If your wrapper uses different arg names, fall back to the simplest form
-        raw = search_fn(query, 24)
+    # Pull more than we need so we can rank. The query is one of three fixed
+    # strings, so the (user-independent) results are shared through the cache.
+    cache_key = f"spoon:gaps:{query}:24"
+    raw = cache.get(cache_key)
+    if raw is None:
+        try:
+            raw = search_fn(query=query, number=24, add_recipe_nutrition=True)
+        except TypeError:
+            # If your wrapper uses different arg names, fall back to the simplest form
+            raw = search_fn(query, 24)
+        if raw:  # empty usually means a missing key / quota error: retry next time
+            cache.set(cache_key, raw, SPOON_GAPS_CACHE_TTL)
 
     items = []
     for r in raw or []:
@@ -2724,14 +3704,18 @@ def suggest_recipes_for_gaps(target, totals, search_fn, max_items: int = 4):
         )
 
     # Rank: prefer more protein when protein is short, otherwise aim under the calorie gap
+    # (only the top few are shown: a bounded heap picks them, ties stay stable)
     if protein_gap >= 20:
-        items.sort(
-            key=lambda x: (-x["protein_g"], x["calories"])
-        )  # more protein, lower cals
+
+        def rank(x):
+            return (-x["protein_g"], x["calories"])  # more protein, lower cals
+
     else:
-        items.sort(key=lambda x: (abs(calorie_gap - x["calories"]), -x["protein_g"]))
 
-    return items[:max_items]
+        def rank(x):
+            return (abs(calorie_gap - x["calories"]), -x["protein_g"])
+
+    return heapq.nsmallest(max_items, items, key=rank)
 
 
 @login_required
@@ -2758,17 +3742,25 @@ def nutrition_target_upsert(request):
     # Use localdate for consistency with the rest of the app
     today = timezone.localdate()
 
-    # 1) Pull in today's meal-plan rows as logged meals (don't break page on error)
-    try:
-        sync_logged_meals_from_plan(request.user, today)
-    except Exception:
-        # Keep the page working even if sync fails
-        pass
+    # 1) Pull in today's meal-plan rows as logged meals (don't break page on error).
+    #    Only when today's plan rows changed since the last sync.
+    sync_key = _plan_sync_key(request.user.pk, today)
+    plan_rows = _plan_day_fingerprint(request.user, today)
+    if cache.get(sync_key) != plan_rows:
+        try:
+            sync_logged_meals_from_plan(request.user, today)
+            cache.set(sync_key, plan_rows, PLAN_SYNC_TTL)
+        except Exception:
+            # Keep the page working even if sync fails
+            pass
 
     # 2) Compute totals and today's logged meals
     totals = compute_daily_totals(request.user, today, target)
-    todays_meals = LoggedMeal.objects.filter(user=request.user, date=today).order_by(
-        "id"
+    # Plain dicts with just the columns the list shows (no model instances)
+    todays_meals = (
+        LoggedMeal.objects.filter(user=request.user, date=today)
+        .order_by("id")
+        .values("id", "title", "meal_type", "calories", "protein_g", "carbs_g", "fat_g")
     )
 
     # 3) Suggestions (guarded)
@@ -2786,7 +3778,7 @@ def nutrition_target_upsert(request):
         suggestions = []
 
     # --- Enrich suggestions so recipe_detail has ingredients/steps right away ---
-    bundle = request.session.get("recipe_results") or {}
+    bundle = _load_results(request, "recipe_results", {})
     web_list = bundle.get("web") or []
 
     existing_ids = {str(it.get("id")) for it in web_list if isinstance(it, dict)}
@@ -2833,12 +3825,11 @@ def nutrition_target_upsert(request):
     # keep "combined" in sync if your detail view looks there too
     bundle["combined"] = web_list
 
-    request.session["recipe_results"] = bundle
-    request.session.modified = True
+    _store_results(request, "recipe_results", bundle)
 
     # 4) Merge suggestions into the session bundle used by recipe_detail
     #    IMPORTANT: do not overwrite with raw suggestions; normalize + dedupe.
-    bundle = request.session.get("recipe_results") or {}
+    bundle = _load_results(request, "recipe_results", {})
     web_list = bundle.get("web") or []
     existing_ids = {str(it.get("id")) for it in web_list if isinstance(it, dict)}
 
@@ -2875,8 +3866,7 @@ def nutrition_target_upsert(request):
     bundle["web"] = web_list
     # If your detail page also consults "combined", keep it identical.
     bundle["combined"] = web_list
-    request.session["recipe_results"] = bundle
-    request.session.modified = True
+    _store_results(request, "recipe_results", bundle)
 
     context = {
         "form": form,
@@ -2917,32 +3907,36 @@ def meal_plan_view(request):
 
     plan, _ = MealPlan.objects.get_or_create(user=request.user, start_date=week_start)
 
-    meals = Meal.objects.filter(
-        plan=plan, date__range=[week_start, week_start + dt.timedelta(days=6)]
-    ).select_related("recipe")
-
-    def slot_of(m: Meal):
-        return getattr(m, "meal_type", None) or getattr(m, "slot", None)
-
-    by_key = {(m.date, slot_of(m)): m for m in meals if slot_of(m)}
+    # One query for the week; the grid only shows each recipe's title/calories,
+    # so the JSON ingredient/step columns stay in the DB.
+    meals = (
+        Meal.objects.filter(
+            plan=plan, date__range=[week_start, week_start + dt.timedelta(days=6)]
+        )
+        .select_related("recipe")
+        .only(
+            "id",
+            "date",
+            "meal_type",
+            "recipe",
+            "recipe__id",
+            "recipe__title",
+            "recipe__calories",
+        )
+    )
 
-    if hasattr(Meal, "Slot") and hasattr(Meal.Slot, "choices"):
-        slots = list(Meal.Slot.choices)
-    elif hasattr(Meal, "MEAL_TYPES"):
-        slots = list(Meal.MEAL_TYPES)
-    else:
-        slots = [
-            ("breakfast", "Breakfast"),
-            ("lunch", "Lunch"),
-            ("dinner", "Dinner"),
-            ("snack", "Snack"),
-        ]
-    slot_values = [v for v, _ in slots]
+    by_key = {(m.date, m.meal_type): m for m in meals}
 
-    rows = []
-    for day in week_days:
-        cells = [{"meal": by_key.get((day, sv)), "slot": sv} for sv in slot_values]
-        rows.append({"date": day, "cells": cells})
+    slots = _MEAL_SLOT_CHOICES
+    rows = [
+        {
+            "date": day,
+            "cells": [
+                {"meal": by_key.get((day, sv)), "slot": sv} for sv, _ in slots
+            ],
+        }
+        for day in week_days
+    ]
 
     sel = request.GET.get("recipe")
     try:
@@ -2950,7 +3944,8 @@ def meal_plan_view(request):
     except (TypeError, ValueError):
         selected_recipe_id = None
 
-    favorites = request.user.saved_recipes.all()
+    # Rendered as a <select> in every empty cell: reuse the cached light rows
+    favorites = _favorite_rows(request.user)
 
     return render(
         request,
@@ -2992,7 +3987,7 @@ def meal_add(request):
     plan, _ = MealPlan.objects.get_or_create(user=request.user, start_date=week_start)
 
     # Ensure valid meal_type
-    if meal_type not in [choice[0] for choice in Meal.Slot.choices]:
+    if meal_type not in _MEAL_SLOT_VALUES:
         meal_type = Meal.Slot.LUNCH  # fallback
 
     # Saved recipe
@@ -3039,13 +4034,13 @@ def _thumb_for_title_via_spoonacular(title: str) -> str | None:
         return None
 
     try:
-        r = requests.get(
+        r = _SESSION.get(
             "https://api.spoonacular.com/recipes/complexSearch",
             params={"apiKey": api_key, "query": title, "number": 1},
             timeout=6,
         )
         if r.ok:
-            data = r.json() or {}
+            data = _response_json(r) or {}
             results = data.get("results") or []
             if results:
                 return results[0].get("image")  # usually a CDN URL
@@ -3172,19 +4167,9 @@ def log_custom_meal(request):
             messages.success(request, "Meal logged.")
             return redirect("core:nutrition_target")
 
-        # Check conflict: same slot already set today?
-        conflict = None
-        for item in meals_rel.all():
-            item_date = (
-                getattr(item, "date", None)
-                or getattr(item, "for_date", None)
-                or getattr(item, "scheduled_date", None)
-                or getattr(item, "day", None)
-            )
-            item_slot = getattr(item, "meal_type", None) or getattr(item, "slot", None)
-            if item_date == day and item_slot == meal_type:
-                conflict = item
-                break
+        # Check conflict: same slot already set today? (one probe on the
+        # (plan, date, meal_type) unique index instead of reading the whole plan)
+        conflict = meals_rel.filter(date=day, meal_type=meal_type).exists()
 
         if conflict:
             messages.warning(
@@ -3250,23 +4235,27 @@ def log_recipe_meal(request, rid=None, recipe_id=None):
     if meal_type not in allowed_meals:
         meal_type = "lunch"
 
+    # LoggedMeal stores whole-number macros and a float quantity, so parse
+    # straight to those types (no Decimal round trip per field).
     try:
-        quantity = Decimal(request.POST.get("quantity") or "1")
-    except Exception:
-        quantity = Decimal("1")
+        quantity = float(request.POST.get("quantity") or 1)
+    except (TypeError, ValueError):
+        quantity = 1.0
+    if not math.isfinite(quantity):
+        quantity = 1.0
 
     title = (request.POST.get("title") or "Recipe").strip()
 
-    def dec(name):
+    def amount(name) -> int:
         try:
-            return Decimal(str(request.POST.get(name) or "0"))
-        except Exception:
-            return Decimal("0")
+            return max(0, int(round(float(request.POST.get(name) or 0))))
+        except (TypeError, ValueError, OverflowError):  # junk, NaN, inf
+            return 0
 
-    calories = dec("calories")
-    protein_g = dec("protein_g")
-    carbs_g = dec("carbs_g")
-    fat_g = dec("fat_g")
+    calories = amount("calories")
+    protein_g = amount("protein_g")
+    carbs_g = amount("carbs_g")
+    fat_g = amount("fat_g")
 
     # 2) Choose a stable id to remember where this came from
     #    Prefer the hidden "key" we post from the template; fall back to url key.
@@ -3297,12 +4286,14 @@ def log_recipe_meal(request, rid=None, recipe_id=None):
     if src in {"ai", "web"}:
         fav_qs = fav_qs.filter(source=src)
 
-    fav = fav_qs.first()
+    # Only the pk is needed: slice (LIMIT 1) a values_list rather than .first(),
+    # which would also load the JSON ingredient/step columns of the row.
+    fav_pk = next(iter(fav_qs.values_list("pk", flat=True)[:1]), None)
 
     params = {}
-    if fav:
+    if fav_pk is not None:
         # your meal_plan view supports ?recipe=<fav_pk> to preselect
-        params["recipe"] = fav.pk
+        params["recipe"] = fav_pk
 
     url = reverse("core:meal_plan")
     if params: